@@ -2,43 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import defaultdict
+from functools import lru_cache, wraps
 from typing import Any
 import os
+import re
 
+import anyio.to_thread
+import numpy as np
+import orjson
 import uvicorn
 import httpx
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.routing import Route
 from pydantic import BaseModel
 from dotenv import load_dotenv, find_dotenv
 
 from .bgs_client import BGSClient
 
+# Shared client instances, created once at startup so TCP/TLS handshakes and
+# connection-pool warm-up are not paid on every request.
+_CLIENT: BGSClient | None = None
+_HTTPX: httpx.AsyncClient | None = None
 
+
+@lru_cache(maxsize=1)
 def _get_llm_config() -> dict[str, str]:
+    """Resolve LLM provider settings from the environment (cached after startup)."""
     provider = (os.environ.get("LLM_PROVIDER") or "openai").lower()
     if provider == "anthropic":
-        return {
+        cfg = {
             "provider": "anthropic",
             "model": os.environ.get("ANTHROPIC_MODEL", "claude-3-5-sonnet-latest"),
             "base_url": os.environ.get("ANTHROPIC_BASE_URL", "https://api.anthropic.com/v1"),
             "api_key": os.environ.get("ANTHROPIC_API_KEY") or "",
         }
-    model = os.environ.get("OPENAI_MODEL", "gpt-oss-120b")
-    if model == "gpt-oss-120b":
-        api_key = os.environ.get("OPENAI_API_KEY_OSS") or ""
-    elif model == "gpt-5.2-codex":
-        api_key = os.environ.get("OPENAI_API_KEY") or ""
     else:
-        api_key = os.environ.get("OPENAI_API_KEY") or ""
-    return {
-        "provider": "openai",
-        "model": model,
-        "base_url": os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1"),
-        "api_key": api_key,
+        model = os.environ.get("OPENAI_MODEL", "gpt-oss-120b")
+        if model == "gpt-oss-120b":
+            api_key = os.environ.get("OPENAI_API_KEY_OSS") or ""
+        elif model == "gpt-5.2-codex":
+            api_key = os.environ.get("OPENAI_API_KEY") or ""
+        else:
+            api_key = os.environ.get("OPENAI_API_KEY") or ""
+        cfg = {
+            "provider": "openai",
+            "model": model,
+            "base_url": os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+            "api_key": api_key,
+        }
+    # Precompute the pieces _call_llm needs per request.
+    cfg["url"] = cfg["base_url"].rstrip("/") + "/chat/completions"
+    cfg["headers"] = {
+        "Authorization": f"Bearer {cfg['api_key']}",
+        "Content-Type": "application/json",
     }
+    return cfg
 
 
+@lru_cache(maxsize=1)
 def _qa_system_prompt() -> str:
     return (
         "You are a data analyst. Answer using only the provided context. "
@@ -55,22 +82,26 @@ async def _call_llm(question: str, context: dict[str, Any] | None) -> tuple[str,
     if not cfg["api_key"]:
         raise HTTPException(status_code=400, detail="Missing API key for LLM provider")
 
+    # Canonical JSON (sorted keys) keeps the context compact and stable so
+    # upstream prompt caches can hit.
+    ctx = orjson.dumps(context or {}, option=orjson.OPT_SORT_KEYS).decode()
     payload = {
         "model": cfg["model"],
         "messages": [
             {"role": "system", "content": _qa_system_prompt()},
-            {"role": "user", "content": f"Question: {question}\n\nContext:\n{context or {}}"},
+            {"role": "user", "content": f"Question: {question}\n\nContext:\n{ctx}"},
         ],
         "temperature": 0.2,
     }
 
-    headers = {"Authorization": f"Bearer {cfg['api_key']}"}
-    url = cfg["base_url"].rstrip("/") + "/chat/completions"
-    async with httpx.AsyncClient(timeout=60) as client:
-        resp = await client.post(url, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            raise HTTPException(status_code=502, detail=f"LLM error: {resp.text}")
-        data = resp.json()
+    resp = await _get_httpx().post(
+        cfg["url"],
+        content=orjson.dumps(payload),
+        headers=cfg["headers"],
+    )
+    if resp.status_code >= 400:
+        raise HTTPException(status_code=502, detail=f"LLM error: {resp.text}")
+    data = orjson.loads(resp.content)
 
     answer = data["choices"][0]["message"]["content"]
     return answer, cfg["model"], cfg["provider"]
@@ -99,20 +130,72 @@ REST API for accessing British Geological Survey World Mineral Statistics.
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-# Enable CORS for browser-based LLM applications
+# Enable CORS for browser-based LLM applications. A concrete origin
+# allowlist (BGS_API_CORS_ORIGINS, comma-separated) lets the middleware do
+# exact-string origin checks, and max_age keeps browsers from
+# re-preflighting every call.
+_cors_origins = [
+    origin.strip()
+    for origin in os.environ.get("BGS_API_CORS_ORIGINS", "*").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=_cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
+# Large list responses (production search/compare) are highly repetitive
+# JSON and compress well; small responses skip compression entirely.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 load_dotenv(find_dotenv(), override=True)
 
 
+def _get_httpx() -> httpx.AsyncClient:
+    global _HTTPX
+    if _HTTPX is None:
+        _HTTPX = httpx.AsyncClient(
+            http2=True,
+            timeout=60,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=60,
+            ),
+        )
+    return _HTTPX
+
+
+@app.on_event("startup")
+async def _startup() -> None:
+    """Warm the shared BGS and HTTP clients before serving traffic."""
+    global _CLIENT
+    _CLIENT = BGSClient()
+    _get_httpx()
+    # Env may have changed between import (load_dotenv) and serve time.
+    _get_llm_config.cache_clear()
+    # Sync callables (dependencies, file I/O) run on anyio's threadpool,
+    # which defaults to 40 tokens and becomes the ceiling under burst load.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.environ.get("BGS_API_THREAD_LIMIT", "100"))
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    global _CLIENT, _HTTPX
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+        _HTTPX = None
+    _CLIENT = None
+
+
 # Response models
 class CommodityList(BaseModel):
     """List of available commodities."""
@@ -232,9 +315,108 @@ class OpenAIFunction(BaseModel):
     parameters: dict[str, Any]
 
 
-# Client instance
+# Read-endpoint TTL cache. BGS statistics change rarely, so duplicate
+# upstream fetches within the TTL window are served from memory. In-flight
+# requests are deduplicated so a burst of identical queries triggers a
+# single upstream call.
+_CACHE_TTL = float(os.environ.get("BGS_API_CACHE_TTL", "300"))
+_CACHE_MAX_ENTRIES = 1024
+
+
+def _ttl_cached(ttl: float = _CACHE_TTL):
+    """Async-safe TTL memoizer keyed on the full argument tuple."""
+
+    def decorator(fn):
+        cache: dict[tuple, tuple[float, Any]] = {}
+        inflight: dict[tuple, asyncio.Task] = {}
+
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                return hit[1]
+
+            task = inflight.get(key)
+            if task is not None:
+                return await task
+
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            inflight[key] = task
+            try:
+                result = await task
+            finally:
+                inflight.pop(key, None)
+
+            if len(cache) >= _CACHE_MAX_ENTRIES:
+                now = time.monotonic()
+                for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+                    del cache[stale]
+                if len(cache) >= _CACHE_MAX_ENTRIES:
+                    cache.clear()
+            cache[key] = (time.monotonic() + ttl, result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+# Commodity categorization: one compiled alternation, one C-level scan per
+# name, with group index mapping back to the category.
+_CATEGORY_ORDER = (
+    "battery",
+    "rare_earth",
+    "strategic",
+    "technology",
+    "base_metals",
+    "precious",
+    "industrial",
+)
+_CAT_RE = re.compile(
+    r"(lithium|cobalt|nickel|graphite|manganese)"
+    r"|(rare earth)"
+    r"|(platinum|vanadium|tungsten|chromium|tantalum|niobium|titanium)"
+    r"|(gallium|germanium|indium|beryl|selenium|rhenium)"
+    r"|(copper|zinc|lead|tin|aluminium|bauxite|alumina|iron)"
+    r"|(gold|silver)"
+    r"|(fluorspar|magnesite|phosphate|barytes|borate)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=8)
+def _categorize_commodities(commodities: tuple[str, ...]) -> dict[str, list[str]]:
+    """Group commodity names by category, dropping empty categories."""
+    categories: dict[str, list[str]] = {cat: [] for cat in _CATEGORY_ORDER}
+    categories["other"] = []
+    for c in commodities:
+        m = _CAT_RE.search(c)
+        cat = _CATEGORY_ORDER[m.lastindex - 1] if m else "other"
+        categories[cat].append(c)
+    return {k: v for k, v in categories.items() if v}
+
+
+def _split_country(country: str | None) -> tuple[str | None, str | None]:
+    """Split a country query into (name, iso_code).
+
+    Short inputs (<= 3 chars) are treated as ISO codes and normalized to
+    uppercase so lowercase codes like "aus" resolve correctly.
+    """
+    if not country:
+        return None, None
+    if len(country) <= 3:
+        return None, country.upper()
+    return country, None
+
+
+# Client instance (shared; created at startup, lazily as a fallback)
 def get_client() -> BGSClient:
-    return BGSClient()
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = BGSClient()
+    return _CLIENT
 
 
 # Endpoints
@@ -260,6 +442,7 @@ async def root():
 
 
 @app.get("/commodities", response_model=CommodityList, tags=["Commodities"])
+@_ttl_cached()
 async def list_commodities(
     critical_only: bool = Query(
         False,
@@ -284,63 +467,7 @@ async def list_commodities(
 
     categories = None
     if categorize:
-        categories = {
-            "battery": [],
-            "rare_earth": [],
-            "strategic": [],
-            "technology": [],
-            "base_metals": [],
-            "precious": [],
-            "industrial": [],
-            "other": [],
-        }
-
-        for c in commodities:
-            cl = c.lower()
-            if any(x in cl for x in ["lithium", "cobalt", "nickel", "graphite", "manganese"]):
-                categories["battery"].append(c)
-            elif "rare earth" in cl:
-                categories["rare_earth"].append(c)
-            elif any(
-                x in cl
-                for x in [
-                    "platinum",
-                    "vanadium",
-                    "tungsten",
-                    "chromium",
-                    "tantalum",
-                    "niobium",
-                    "titanium",
-                ]
-            ):
-                categories["strategic"].append(c)
-            elif any(
-                x in cl for x in ["gallium", "germanium", "indium", "beryl", "selenium", "rhenium"]
-            ):
-                categories["technology"].append(c)
-            elif any(
-                x in cl
-                for x in [
-                    "copper",
-                    "zinc",
-                    "lead",
-                    "tin",
-                    "aluminium",
-                    "bauxite",
-                    "alumina",
-                    "iron",
-                ]
-            ):
-                categories["base_metals"].append(c)
-            elif any(x in cl for x in ["gold", "silver"]):
-                categories["precious"].append(c)
-            elif any(x in cl for x in ["fluorspar", "magnesite", "phosphate", "barytes", "borate"]):
-                categories["industrial"].append(c)
-            else:
-                categories["other"].append(c)
-
-        # Remove empty categories
-        categories = {k: v for k, v in categories.items() if v}
+        categories = _categorize_commodities(tuple(commodities))
 
     return CommodityList(
         total=len(commodities),
@@ -350,6 +477,7 @@ async def list_commodities(
 
 
 @app.get("/countries", response_model=CountryList, tags=["Countries"])
+@_ttl_cached()
 async def list_countries(
     commodity: str | None = Query(
         None,
@@ -366,11 +494,62 @@ async def list_countries(
 
     return CountryList(
         total=len(countries),
-        countries=[CountryInfo(**c) for c in countries],
+        countries=[CountryInfo.model_construct(**c) for c in countries],
+    )
+
+
+def _record_dict(r) -> dict[str, Any]:
+    return {
+        "commodity": r.commodity,
+        "country": r.country,
+        "country_iso3": r.country_iso3,
+        "year": r.year,
+        "quantity": r.quantity,
+        "units": r.units,
+    }
+
+
+@_ttl_cached()
+async def _search_production(
+    commodity: str,
+    country: str | None,
+    year_from: int | None,
+    year_to: int | None,
+    statistic_type: str,
+    limit: int,
+) -> dict[str, Any]:
+    country_name, country_iso = _split_country(country)
+
+    records = await get_client().search_production(
+        commodity=commodity,
+        country=country_name,
+        country_iso=country_iso,
+        year_from=year_from,
+        year_to=year_to,
+        statistic_type=statistic_type,
+        limit=limit,
     )
 
+    # Plain dicts: per-record Pydantic validation dominates on large payloads,
+    # and the upstream client already returns validated records.
+    return {
+        "query": {
+            "commodity": commodity,
+            "country": country,
+            "year_from": year_from,
+            "year_to": year_to,
+            "statistic_type": statistic_type,
+        },
+        "total": len(records),
+        "records": [_record_dict(r) for r in records],
+    }
 
-@app.get("/production/search", response_model=ProductionResponse, tags=["Production"])
+
+@app.get(
+    "/production/search",
+    tags=["Production"],
+    responses={200: {"model": ProductionResponse}},
+)
 async def search_production(
     commodity: str = Query(
         ..., description="Commodity name (e.g., 'lithium minerals', 'cobalt, mine')"
@@ -380,6 +559,7 @@ async def search_production(
     year_to: int | None = Query(None, description="End year (inclusive)"),
     statistic_type: str = Query("Production", description="Production, Imports, or Exports"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
+    format: str = Query("json", description="'json' or 'ndjson' (streamed, one record per line)"),
 ):
     """
     Search for mineral production or trade data.
@@ -389,48 +569,33 @@ async def search_production(
     - Cobalt in DRC: `?commodity=cobalt, mine&country=COD`
     - Recent copper: `?commodity=copper, mine&year_from=2020`
     """
-    client = get_client()
+    if format == "ndjson":
+        # Stream records as they are serialized instead of building the
+        # full response in memory; lowers TTFB for large limits.
+        country_name, country_iso = _split_country(country)
+        records = await get_client().search_production(
+            commodity=commodity,
+            country=country_name,
+            country_iso=country_iso,
+            year_from=year_from,
+            year_to=year_to,
+            statistic_type=statistic_type,
+            limit=limit,
+        )
 
-    country_iso = None
-    country_name = country
-    if country and len(country) <= 3:
-        country_iso = country
-        country_name = None
+        async def _stream():
+            for r in records:
+                yield orjson.dumps(_record_dict(r)) + b"\n"
 
-    records = await client.search_production(
-        commodity=commodity,
-        country=country_name,
-        country_iso=country_iso,
-        year_from=year_from,
-        year_to=year_to,
-        statistic_type=statistic_type,
-        limit=limit,
-    )
+        return StreamingResponse(_stream(), media_type="application/x-ndjson")
 
-    return ProductionResponse(
-        query={
-            "commodity": commodity,
-            "country": country,
-            "year_from": year_from,
-            "year_to": year_to,
-            "statistic_type": statistic_type,
-        },
-        total=len(records),
-        records=[
-            ProductionRecord(
-                commodity=r.commodity,
-                country=r.country,
-                country_iso3=r.country_iso3,
-                year=r.year,
-                quantity=r.quantity,
-                units=r.units,
-            )
-            for r in records
-        ],
+    return await _search_production(
+        commodity, country, year_from, year_to, statistic_type, limit
     )
 
 
 @app.get("/production/ranking", response_model=RankingResponse, tags=["Production"])
+@_ttl_cached()
 async def get_commodity_ranking(
     commodity: str = Query(..., description="Commodity name"),
     year: int | None = Query(None, description="Year (defaults to most recent)"),
@@ -466,7 +631,7 @@ async def get_commodity_ranking(
     for i, r in enumerate(ranked, 1):
         share = (r["quantity"] / total * 100) if total > 0 else 0
         rankings.append(
-            RankedCountry(
+            RankedCountry.model_construct(
                 rank=i,
                 country=r["country"],
                 country_iso3=r["country_iso3"],
@@ -485,7 +650,27 @@ async def get_commodity_ranking(
     )
 
 
+def _yoy_points(years: list[int], quantities: list[float]) -> list[TimeSeriesPoint]:
+    """Build time-series points with vectorized year-over-year percent changes."""
+    qty = np.asarray(quantities, dtype=np.float64)
+    yoy = np.full(qty.shape, np.nan)
+    if qty.size > 1:
+        prev = qty[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            yoy[1:] = np.where(prev > 0, (qty[1:] - prev) / prev * 100, np.nan)
+        yoy = np.round(yoy, 2)
+    return [
+        TimeSeriesPoint.model_construct(
+            year=year,
+            quantity=quantity,
+            yoy_change_percent=None if np.isnan(change) else float(change),
+        )
+        for year, quantity, change in zip(years, quantities, yoy)
+    ]
+
+
 @app.get("/production/timeseries", response_model=TimeSeriesResponse, tags=["Production"])
+@_ttl_cached()
 async def get_time_series(
     commodity: str = Query(..., description="Commodity name"),
     country: str | None = Query(None, description="Country name or ISO code (omit for global)"),
@@ -502,11 +687,7 @@ async def get_time_series(
     """
     client = get_client()
 
-    country_iso = None
-    country_name = country
-    if country and len(country) <= 3:
-        country_iso = country
-        country_name = None
+    country_name, country_iso = _split_country(country)
 
     records = await client.get_time_series(
         commodity=commodity,
@@ -529,15 +710,8 @@ async def get_time_series(
                 year_totals[r.year] += r.quantity
                 units = r.units
 
-        data = []
-        prev_qty = None
-        for year in sorted(year_totals.keys()):
-            qty = year_totals[year]
-            yoy = None
-            if prev_qty and prev_qty > 0:
-                yoy = round(((qty - prev_qty) / prev_qty) * 100, 2)
-            data.append(TimeSeriesPoint(year=year, quantity=qty, yoy_change_percent=yoy))
-            prev_qty = qty
+        years = sorted(year_totals)
+        data = _yoy_points(years, [year_totals[y] for y in years])
 
         return TimeSeriesResponse(
             commodity=commodity,
@@ -550,17 +724,8 @@ async def get_time_series(
         actual_country = records[0].country if records else country
         units = records[0].units if records else None
 
-        data = []
-        prev_qty = None
-        for r in records:
-            if r.year and r.quantity is not None:
-                yoy = None
-                if prev_qty and prev_qty > 0:
-                    yoy = round(((r.quantity - prev_qty) / prev_qty) * 100, 2)
-                data.append(
-                    TimeSeriesPoint(year=r.year, quantity=r.quantity, yoy_change_percent=yoy)
-                )
-                prev_qty = r.quantity
+        points = [(r.year, r.quantity) for r in records if r.year and r.quantity is not None]
+        data = _yoy_points([p[0] for p in points], [p[1] for p in points])
 
         return TimeSeriesResponse(
             commodity=commodity,
@@ -572,6 +737,7 @@ async def get_time_series(
 
 
 @app.get("/production/compare", response_model=ComparisonResponse, tags=["Production"])
+@_ttl_cached()
 async def compare_countries(
     commodity: str = Query(..., description="Commodity name"),
     countries: str = Query(..., description="Comma-separated country names or ISO codes"),
@@ -615,7 +781,12 @@ async def compare_countries(
     )
 
 
-@app.get("/countries/{country}/profile", response_model=CountryProfile, tags=["Countries"])
+@app.get(
+    "/countries/{country}/profile",
+    tags=["Countries"],
+    responses={200: {"model": CountryProfile}},
+)
+@_ttl_cached()
 async def get_country_profile(
     country: str,
     year: int | None = Query(None, description="Year (defaults to most recent)"),
@@ -630,15 +801,15 @@ async def get_country_profile(
     """
     client = get_client()
 
-    country_iso = None
-    country_name = country
-    if len(country) <= 3:
-        country_iso = country
-        country_name = None
+    country_name, country_iso = _split_country(country)
 
+    # When the caller pins a year, filter upstream so only that year's rows
+    # cross the wire; otherwise fetch everything to discover the latest year.
     records = await client.search_production(
         country=country_name,
         country_iso=country_iso,
+        year_from=year,
+        year_to=year,
         statistic_type=statistic_type,
         limit=5000,
     )
@@ -647,23 +818,21 @@ async def get_country_profile(
         raise HTTPException(status_code=404, detail=f"No data found for {country}")
 
     actual_country = records[0].country
-    available_years = set(r.year for r in records if r.year)
 
-    if year is None and available_years:
-        year = max(available_years)
+    if year is None:
+        year = max((r.year for r in records if r.year), default=None)
 
-    # Aggregate by commodity
-    commodity_data = {}
+    # Aggregate by commodity in a single pass
+    commodity_data: defaultdict[str, dict[str, Any]] = defaultdict(dict)
     for r in records:
-        if r.year != year:
+        if r.year != year or r.quantity is None:
             continue
-        if r.quantity is None:
-            continue
-
-        key = r.commodity
-        if key not in commodity_data:
-            commodity_data[key] = {"commodity": key, "quantity": 0, "units": r.units}
-        commodity_data[key]["quantity"] += r.quantity
+        entry = commodity_data[r.commodity]
+        if not entry:
+            entry["commodity"] = r.commodity
+            entry["quantity"] = 0.0
+            entry["units"] = r.units
+        entry["quantity"] += r.quantity
 
     # Sort by quantity
     commodities = sorted(
@@ -672,117 +841,124 @@ async def get_country_profile(
         reverse=True,
     )
 
-    return CountryProfile(
-        country=actual_country,
-        year=year,
-        statistic_type=statistic_type,
-        commodities=commodities,
-    )
-
+    return {
+        "country": actual_country,
+        "year": year,
+        "statistic_type": statistic_type,
+        "commodities": commodities,
+    }
 
-# OpenAI-compatible function definitions
-@app.get("/openai/functions", response_model=list[OpenAIFunction], tags=["LLM Integration"])
-async def get_openai_functions():
-    """
-    Get OpenAI-compatible function definitions for use with GPT models.
 
-    Copy these into your OpenAI `tools` parameter for function calling.
-    """
-    return [
-        OpenAIFunction(
-            name="search_mineral_production",
-            description="Search for mineral production data by commodity, country, and year range",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "commodity": {
-                        "type": "string",
-                        "description": "Mineral commodity name (e.g., 'lithium minerals', 'cobalt, mine', 'rare earth minerals')",
-                    },
-                    "country": {
-                        "type": "string",
-                        "description": "Country name or ISO code (e.g., 'Australia', 'AUS', 'CHN')",
-                    },
-                    "year_from": {
-                        "type": "integer",
-                        "description": "Start year (e.g., 2015)",
-                    },
-                    "year_to": {
-                        "type": "integer",
-                        "description": "End year (e.g., 2022)",
-                    },
+# OpenAI-compatible function definitions, built once at import time since
+# they are static.
+_OPENAI_FUNCTIONS = [
+    OpenAIFunction(
+        name="search_mineral_production",
+        description="Search for mineral production data by commodity, country, and year range",
+        parameters={
+            "type": "object",
+            "properties": {
+                "commodity": {
+                    "type": "string",
+                    "description": "Mineral commodity name (e.g., 'lithium minerals', 'cobalt, mine', 'rare earth minerals')",
                 },
-                "required": ["commodity"],
-            },
-        ),
-        OpenAIFunction(
-            name="get_top_producers",
-            description="Get top producing countries for a mineral commodity with market share percentages",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "commodity": {
-                        "type": "string",
-                        "description": "Mineral commodity name",
-                    },
-                    "year": {
-                        "type": "integer",
-                        "description": "Year to query (defaults to most recent)",
-                    },
-                    "top_n": {
-                        "type": "integer",
-                        "description": "Number of top countries to return (default 15)",
-                    },
+                "country": {
+                    "type": "string",
+                    "description": "Country name or ISO code (e.g., 'Australia', 'AUS', 'CHN')",
+                },
+                "year_from": {
+                    "type": "integer",
+                    "description": "Start year (e.g., 2015)",
+                },
+                "year_to": {
+                    "type": "integer",
+                    "description": "End year (e.g., 2022)",
                 },
-                "required": ["commodity"],
             },
-        ),
-        OpenAIFunction(
-            name="get_production_time_series",
-            description="Get historical time series of mineral production for trend analysis",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "commodity": {
-                        "type": "string",
-                        "description": "Mineral commodity name",
-                    },
-                    "country": {
-                        "type": "string",
-                        "description": "Country name or ISO code (omit for global total)",
-                    },
+            "required": ["commodity"],
+        },
+    ),
+    OpenAIFunction(
+        name="get_top_producers",
+        description="Get top producing countries for a mineral commodity with market share percentages",
+        parameters={
+            "type": "object",
+            "properties": {
+                "commodity": {
+                    "type": "string",
+                    "description": "Mineral commodity name",
+                },
+                "year": {
+                    "type": "integer",
+                    "description": "Year to query (defaults to most recent)",
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "Number of top countries to return (default 15)",
                 },
-                "required": ["commodity"],
             },
-        ),
-        OpenAIFunction(
-            name="compare_country_production",
-            description="Compare mineral production between multiple countries over time",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "commodity": {
-                        "type": "string",
-                        "description": "Mineral commodity name",
-                    },
-                    "countries": {
-                        "type": "string",
-                        "description": "Comma-separated country names or ISO codes (e.g., 'AUS,CHL,CHN')",
-                    },
+            "required": ["commodity"],
+        },
+    ),
+    OpenAIFunction(
+        name="get_production_time_series",
+        description="Get historical time series of mineral production for trend analysis",
+        parameters={
+            "type": "object",
+            "properties": {
+                "commodity": {
+                    "type": "string",
+                    "description": "Mineral commodity name",
+                },
+                "country": {
+                    "type": "string",
+                    "description": "Country name or ISO code (omit for global total)",
                 },
-                "required": ["commodity", "countries"],
             },
-        ),
-        OpenAIFunction(
-            name="list_critical_minerals",
-            description="List all available critical minerals in the database",
-            parameters={
-                "type": "object",
-                "properties": {},
-                "required": [],
+            "required": ["commodity"],
+        },
+    ),
+    OpenAIFunction(
+        name="compare_country_production",
+        description="Compare mineral production between multiple countries over time",
+        parameters={
+            "type": "object",
+            "properties": {
+                "commodity": {
+                    "type": "string",
+                    "description": "Mineral commodity name",
+                },
+                "countries": {
+                    "type": "string",
+                    "description": "Comma-separated country names or ISO codes (e.g., 'AUS,CHL,CHN')",
+                },
             },
-        ),
-    ]
+            "required": ["commodity", "countries"],
+        },
+    ),
+    OpenAIFunction(
+        name="list_critical_minerals",
+        description="List all available critical minerals in the database",
+        parameters={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+]
+
+
+_OPENAI_FUNCTIONS_BYTES = orjson.dumps([f.model_dump() for f in _OPENAI_FUNCTIONS])
+
+
+@app.get("/openai/functions", response_model=list[OpenAIFunction], tags=["LLM Integration"])
+async def get_openai_functions():
+    """
+    Get OpenAI-compatible function definitions for use with GPT models.
+
+    Copy these into your OpenAI `tools` parameter for function calling.
+    """
+    return Response(content=_OPENAI_FUNCTIONS_BYTES, media_type="application/json")
 
 
 @app.post("/qa", response_model=QAResponse, tags=["LLM"])
@@ -794,14 +970,44 @@ async def ask_question(payload: QARequest):
     return QAResponse(answer=answer, model=model, provider=provider)
 
 
+# Serve /openapi.json from prebuilt orjson bytes. FastAPI regenerates the
+# schema by walking every route and Pydantic model on each request; the
+# schema is static once routes are registered, so build it lazily once and
+# replace the default route with one that returns the cached bytes.
+_OPENAPI_BYTES: bytes | None = None
+
+
+async def _openapi_json(request):
+    global _OPENAPI_BYTES
+    if _OPENAPI_BYTES is None:
+        _OPENAPI_BYTES = orjson.dumps(app.openapi())
+    return Response(content=_OPENAPI_BYTES, media_type="application/json")
+
+
+for _i, _route in enumerate(app.router.routes):
+    if getattr(_route, "path", None) == "/openapi.json":
+        app.router.routes[_i] = Route("/openapi.json", _openapi_json, include_in_schema=False)
+        break
+
+
 def main():
-    """Run the REST API server."""
+    """Run the REST API server.
+
+    Tunables (env vars): BGS_API_WORKERS, BGS_API_LIMIT_CONCURRENCY,
+    BGS_API_RELOAD.
+    """
     reload_flag = os.environ.get("BGS_API_RELOAD", "0").lower() in {"1", "true", "yes"}
     uvicorn.run(
         "bgs_mcp.api:app",
         host="0.0.0.0",
         port=8000,
         reload=reload_flag,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("BGS_API_WORKERS", "1")),
+        limit_concurrency=int(os.environ.get("BGS_API_LIMIT_CONCURRENCY", "200")),
+        timeout_keep_alive=15,
+        backlog=2048,
     )
 
 
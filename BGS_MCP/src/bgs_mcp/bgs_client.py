@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from pydantic import BaseModel
@@ -192,18 +193,26 @@ class BGSClient:
         year_to: int | None = None,
         statistic_type: str = "Production",
     ) -> dict[str, list[dict[str, Any]]]:
-        result = {}
-        for country in countries:
-            records = await self.search_production(
-                commodity=commodity,
-                country=country if len(country) > 3 else None,
-                country_iso=country if len(country) <= 3 else None,
-                year_from=year_from,
-                year_to=year_to,
-                statistic_type=statistic_type,
-                limit=1000,
-            )
+        # Fan out per-country fetches concurrently; the semaphore keeps the
+        # burst against the upstream BGS service bounded.
+        semaphore = asyncio.Semaphore(10)
+
+        async def fetch(country: str) -> list[MineralRecord]:
+            async with semaphore:
+                return await self.search_production(
+                    commodity=commodity,
+                    country=country if len(country) > 3 else None,
+                    country_iso=country if len(country) <= 3 else None,
+                    year_from=year_from,
+                    year_to=year_to,
+                    statistic_type=statistic_type,
+                    limit=1000,
+                )
+
+        fetched = await asyncio.gather(*(fetch(country) for country in countries))
 
+        result = {}
+        for country, records in zip(countries, fetched):
             country_name = records[0].country if records else country
             result[country_name] = [
                 {"year": r.year, "quantity": r.quantity, "units": r.units}
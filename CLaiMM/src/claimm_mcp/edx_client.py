@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +49,11 @@ class Submission(BaseModel):
     metadata_created: str | None = None
     metadata_modified: str | None = None
 
+    @cached_property
+    def formats(self) -> frozenset[str]:
+        """File formats present across this submission's resources, computed once."""
+        return frozenset(r.format for r in self.resources if r.format)
+
 
 class EDXClient:
     """Async client for NETL EDX API."""
@@ -206,6 +212,11 @@ class EDXClient:
         """
         Get detailed metadata for a submission (dataset).
 
+        The returned submission's resources are eagerly populated from the
+        single package_show response (CKAN embeds them), so callers like
+        get_dataset_details make exactly one HTTP call regardless of resource
+        count — never follow up with per-resource resource_show requests.
+
         Args:
             submission_id: The submission/package ID or name
 
@@ -290,6 +301,7 @@ class EDXClient:
         query: str | None = None,
         tags: list[str] | None = None,
         groups: list[str] | None = None,
+        format: str | None = None,
         limit: int = 20,
         offset: int = 0,
     ) -> list[Submission]:
@@ -300,21 +312,27 @@ class EDXClient:
             query: Free text search query
             tags: Filter by tags
             groups: Filter by groups (if None, searches CLAIMM-related data)
+            format: Filter to datasets with a resource of this format
+                (pushed into the CKAN query as `fq=res_format:...`)
             limit: Maximum number of results
             offset: Number of results to skip
 
         Returns:
             List of matching submissions
         """
-        # Group filtering is not yet supported in cmm_data core client.
-        # Fall back to direct CKAN package_search in this specialized case.
-        if groups:
+        # Group and format filtering are not supported by the cmm_data core
+        # client. Fall back to direct CKAN package_search in those cases so
+        # the server returns already-filtered results instead of over-fetching
+        # and discarding client-side.
+        if groups or format:
             fq_parts = []
-            for group in groups:
+            for group in groups or []:
                 fq_parts.append(f"groups:{group}")
             if tags:
                 for tag in tags:
                     fq_parts.append(f"tags:{tag}")
+            if format:
+                fq_parts.append(f"res_format:{format.upper()}")
 
             params: dict[str, Any] = {"rows": limit, "start": offset}
             if query:
@@ -757,10 +775,16 @@ class EDXClient:
         await self._request("POST", "package_delete", data={"id": submission_id})
         return True
 
-    def get_download_url(self, resource_id: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def get_download_url(resource_id: str) -> str:
         """
         Get the download URL for a resource.
 
+        The URL is a deterministic function of the resource ID, so results
+        are memoized — the output-formatting loops that call this per
+        resource hit a dict lookup instead of rebuilding the string.
+
         Args:
             resource_id: The resource ID
 
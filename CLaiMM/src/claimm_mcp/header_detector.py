@@ -29,60 +29,98 @@ class HeaderDetector:
         # Bytes to fetch for header detection
         self.csv_fetch_bytes = 8192  # 8KB should be enough for headers
         self.xlsx_fetch_bytes = 65536  # 64KB for Excel (need more for structure)
+        # Non-null samples per column before its inferred type is frozen
+        self.type_freeze_samples = 20
+
+    async def _fetch_prefix(
+        self,
+        download_url: str,
+        max_bytes: int,
+        max_lines: int | None = None,
+        timeout: float = 30.0,
+    ) -> tuple[bytes, bool, int | None]:
+        """
+        Stream the start of a file, stopping once enough data has arrived.
+
+        Issues a Range request but also cuts the transfer off client-side, so
+        servers that ignore Range (and return 200 with the full body) don't
+        force a full download into memory.
+
+        Returns:
+            (prefix bytes, whether the content is partial, HTTP error status
+            or None)
+        """
+        range_headers = {
+            **self.headers,
+            "Range": f"bytes=0-{max_bytes - 1}",
+        }
+
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            async with client.stream(
+                "GET",
+                download_url,
+                headers=range_headers,
+                follow_redirects=True,
+            ) as response:
+                if response.status_code not in (200, 206):
+                    return b"", False, response.status_code
+
+                chunks: list[bytes] = []
+                fetched = 0
+                lines_seen = 0
+                truncated = False
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    fetched += len(chunk)
+                    if max_lines is not None:
+                        lines_seen += chunk.count(b"\n")
+                    if fetched >= max_bytes or (max_lines is not None and lines_seen > max_lines):
+                        truncated = True
+                        break
+
+        partial = truncated or response.status_code == 206
+        return b"".join(chunks)[:max_bytes], partial, None
 
     async def detect_csv_headers(
         self,
         resource_id: str,
         delimiter: str | None = None,
+        max_rows: int = 50,
     ) -> dict[str, Any]:
         """
-        Detect CSV column headers by fetching only the first portion of the file.
+        Detect CSV column headers by streaming only the first portion of the file.
 
         Args:
             resource_id: EDX resource ID
             delimiter: CSV delimiter (auto-detected if not provided)
+            max_rows: Stop fetching once this many rows have arrived
 
         Returns:
             Dict with headers, sample_rows, detected_types, and metadata
         """
         download_url = f"https://edx.netl.doe.gov/resource/{resource_id}/download"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # First, try a Range request
-            range_headers = {
-                **self.headers,
-                "Range": f"bytes=0-{self.csv_fetch_bytes - 1}",
+        try:
+            raw, partial, error_status = await self._fetch_prefix(
+                download_url,
+                self.csv_fetch_bytes,
+                max_lines=max_rows,
+            )
+        except (httpx.HTTPStatusError, httpx.ConnectError, OSError) as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "resource_id": resource_id,
             }
 
-            try:
-                response = await client.get(
-                    download_url,
-                    headers=range_headers,
-                    follow_redirects=True,
-                )
+        if error_status is not None:
+            return {
+                "success": False,
+                "error": f"HTTP {error_status}",
+                "resource_id": resource_id,
+            }
 
-                # Check if server supports range requests
-                if response.status_code == 206:  # Partial Content
-                    content = response.text
-                    partial = True
-                elif response.status_code == 200:
-                    # Server doesn't support range, but returned full content
-                    # Only use first portion
-                    content = response.text[: self.csv_fetch_bytes]
-                    partial = len(response.text) > self.csv_fetch_bytes
-                else:
-                    return {
-                        "success": False,
-                        "error": f"HTTP {response.status_code}",
-                        "resource_id": resource_id,
-                    }
-
-            except (httpx.HTTPStatusError, httpx.ConnectError, OSError) as e:
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "resource_id": resource_id,
-                }
+        content = raw.decode("utf-8", errors="replace")
 
         # Parse CSV content
         return self._parse_csv_content(content, resource_id, delimiter, partial)
@@ -128,10 +166,11 @@ class HeaderDetector:
             }
 
         headers = rows[0]
-        sample_rows = rows[1:6] if len(rows) > 1 else []  # Up to 5 sample rows
+        data_rows = rows[1:]
+        sample_rows = data_rows[:5]  # Up to 5 sample rows
 
-        # Detect column types from sample data
-        column_types = self._detect_column_types(headers, sample_rows)
+        # Type inference sees all fetched rows but freezes each column early
+        column_types = self._detect_column_types(headers, data_rows)
 
         return {
             "success": True,
@@ -157,24 +196,35 @@ class HeaderDetector:
         headers: list[str],
         sample_rows: list[list[str]],
     ) -> list[dict[str, Any]]:
-        """Infer column types from sample data."""
+        """
+        Infer column types from sample data.
+
+        Each column is scanned row-by-row and frozen once enough non-null
+        values have been seen (`type_freeze_samples`), so wide samples don't
+        pay for a full scan of columns whose type is already determined.
+        """
         if not sample_rows:
             return [{"name": h, "type": "unknown"} for h in headers]
 
         column_types = []
         for i, header in enumerate(headers):
-            values = [row[i] if i < len(row) else "" for row in sample_rows]
-            values = [v for v in values if v.strip()]  # Non-empty values
+            values: list[str] = []
+            nullable = False
+            for row in sample_rows:
+                v = row[i] if i < len(row) else ""
+                if v.strip():
+                    values.append(v)
+                    if len(values) >= self.type_freeze_samples:
+                        break
+                else:
+                    nullable = True
 
             col_type = self._infer_type(values)
             column_types.append(
                 {
                     "name": header,
                     "type": col_type["type"],
-                    "nullable": any(
-                        not v.strip()
-                        for v in [row[i] if i < len(row) else "" for row in sample_rows]
-                    ),
+                    "nullable": nullable,
                     "sample_values": values[:3],
                     **col_type.get("metadata", {}),
                 }
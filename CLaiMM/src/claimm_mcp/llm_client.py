@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import Any
 
 import litellm
@@ -10,6 +11,16 @@ import litellm
 from .config import get_settings
 from .edx_client import Resource, Submission
 
+# LLM responses are cached per normalized input so repeated tool calls in a
+# session don't pay a multi-second completion round-trip twice.
+_CACHE_TTL = 900.0
+_CACHE_MAX_ENTRIES = 512
+
+
+def _normalize(text: str) -> str:
+    """Collapse case and whitespace so trivially-equivalent queries share a cache key."""
+    return " ".join(text.lower().split())
+
 
 class LLMClient:
     """Multi-provider LLM client using LiteLLM."""
@@ -26,6 +37,22 @@ class LLMClient:
                 "GOOGLE_API_KEY, or XAI_API_KEY"
             )
 
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+
+    def _cache_get(self, key: tuple) -> Any | None:
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: tuple, value: Any) -> None:
+        if len(self._cache) >= _CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            self._cache = {k: v for k, v in self._cache.items() if now - v[0] < _CACHE_TTL}
+            if len(self._cache) >= _CACHE_MAX_ENTRIES:
+                self._cache.clear()
+        self._cache[key] = (time.monotonic(), value)
+
     async def _complete(
         self,
         messages: list[dict[str, str]],
@@ -52,6 +79,11 @@ class LLMClient:
             - tags: List of relevant tags
             - format_filter: File format filter (if applicable)
         """
+        cache_key = ("interpret", _normalize(natural_query))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         system_prompt = """You are a search query interpreter for the NETL Energy Data eXchange (EDX) CLAIMM database.
 CLAIMM focuses on Critical Minerals and Materials data, including mine waste, mineral resources, and related datasets.
 
@@ -83,14 +115,17 @@ Only include the JSON in your response, no other text."""
         try:
             # Parse the JSON response
             result = json.loads(response.strip())
-            return {
+            interpreted = {
                 "query": result.get("query", natural_query),
                 "tags": result.get("tags", []),
                 "format_filter": result.get("format_filter"),
                 "explanation": result.get("explanation", ""),
             }
+            self._cache_put(cache_key, interpreted)
+            return interpreted
         except json.JSONDecodeError:
-            # Fallback to simple interpretation
+            # Fallback to simple interpretation; not cached so a transient
+            # parse failure doesn't stick for the whole TTL
             return {
                 "query": natural_query,
                 "tags": [],
@@ -116,6 +151,15 @@ Only include the JSON in your response, no other text."""
         if not results:
             return f"No results found for '{original_query}' in the CLAIMM database."
 
+        cache_key = (
+            "summarize",
+            _normalize(original_query),
+            tuple(sorted(sub.id for sub in results)),
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # Build context from results
         results_context = []
         for i, sub in enumerate(results[:10], 1):  # Limit to top 10
@@ -153,7 +197,9 @@ Provide a helpful summary of these results."""
             {"role": "user", "content": user_prompt},
         ]
 
-        return await self._complete(messages, temperature=0.5)
+        summary = await self._complete(messages, temperature=0.5)
+        self._cache_put(cache_key, summary)
+        return summary
 
     async def answer_about_resource(
         self,
@@ -172,6 +218,16 @@ Provide a helpful summary of these results."""
         Returns:
             AI-generated answer based on metadata
         """
+        cache_key = (
+            "answer",
+            resource.id,
+            submission.id if submission else None,
+            _normalize(question),
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         context = f"""
 Resource Information:
 - Name: {resource.name}
@@ -208,7 +264,9 @@ User question: {question}"""
             {"role": "user", "content": user_prompt},
         ]
 
-        return await self._complete(messages, temperature=0.3)
+        answer = await self._complete(messages, temperature=0.3)
+        self._cache_put(cache_key, answer)
+        return answer
 
     async def suggest_related_searches(
         self,
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
+
 import httpx
 from mcp.server.fastmcp import FastMCP
 
 try:
-    from .edx_client import EDXClient
+    from .edx_client import EDXClient, Resource
     from .header_detector import HeaderDetector
     from .llm_client import LLMClient
 except ImportError:
     # Handle direct execution (e.g., mcp dev)
-    from claimm_mcp.edx_client import EDXClient
+    from claimm_mcp.edx_client import EDXClient, Resource
     from claimm_mcp.header_detector import HeaderDetector
     from claimm_mcp.llm_client import LLMClient
 
@@ -22,21 +25,75 @@ mcp = FastMCP(
 )
 
 
+# The clients are stateless between calls, so each is created once and
+# shared by every tool invocation.
+@lru_cache(maxsize=1)
 def get_edx_client() -> EDXClient:
-    """Get or create EDX client instance."""
+    """Get or create the shared EDX client instance."""
     return EDXClient()
 
 
+@lru_cache(maxsize=1)
 def get_llm_client() -> LLMClient:
-    """Get or create LLM client instance."""
+    """Get or create the shared LLM client instance."""
     return LLMClient()
 
 
+@lru_cache(maxsize=1)
 def get_header_detector() -> HeaderDetector:
-    """Get or create HeaderDetector instance."""
+    """Get or create the shared HeaderDetector instance."""
     return HeaderDetector()
 
 
+# Mineral terms common enough that LLM query interpretation adds nothing.
+_KNOWN_MINERALS = frozenset(
+    {
+        "lithium",
+        "cobalt",
+        "nickel",
+        "graphite",
+        "manganese",
+        "gallium",
+        "germanium",
+        "copper",
+        "tungsten",
+        "vanadium",
+        "titanium",
+        "antimony",
+        "rare",
+        "earth",
+        "rare-earth",
+        "ree",
+    }
+)
+
+
+def _is_trivial_query(query: str) -> bool:
+    """True for short, mineral-only queries that can be searched as-is."""
+    tokens = query.lower().split()
+    return 0 < len(tokens) <= 3 and all(t.strip(",.") in _KNOWN_MINERALS for t in tokens)
+
+
+def _short_notes(sub, n: int = 200) -> str:
+    """Truncated submission notes without allocating an empty-string fallback first."""
+    return sub.notes[:n] if sub.notes else ""
+
+
+@lru_cache(maxsize=2048)
+def _resource_line(resource_id: str, name: str, fmt: str | None, prefix: str, max_name: int) -> str:
+    """
+    Formatted download line for a resource.
+
+    Cached on the resource's identity since the same datasets show up across
+    repeated searches and listings; on a hit the truncation, format suffix and
+    URL construction are all skipped.
+    """
+    download_url = EDXClient.get_download_url(resource_id)
+    format_info = f" ({fmt})" if fmt else ""
+    file_name = name[:max_name] + "..." if len(name) > max_name else name
+    return f"{prefix}{file_name}{format_info}: {download_url}"
+
+
 @mcp.tool()
 async def detect_file_schema(
     resource_id: str,
@@ -74,40 +131,42 @@ async def detect_file_schema(
     download_url = edx.get_download_url(resource_id)
 
     # Format output
-    output = "**File Schema Detection**\n\n"
-    output += f"- Resource ID: `{resource_id}`\n"
-    output += f"- Format: {result.get('format', format)}\n"
-    output += f"- Bytes fetched: {result.get('bytes_fetched', 'N/A'):,}\n"
-    output += f"- 📥 Download: {download_url}\n"
+    parts = [
+        "**File Schema Detection**\n",
+        f"- Resource ID: `{resource_id}`",
+        f"- Format: {result.get('format', format)}",
+        f"- Bytes fetched: {result.get('bytes_fetched', 'N/A'):,}",
+        f"- 📥 Download: {download_url}",
+    ]
 
     if result.get("format") == "CSV" or "column_count" in result:
-        output += f"- Columns: {result.get('column_count', 0)}\n"
-        output += f"- Delimiter: `{result.get('delimiter', ',')}`\n\n"
+        parts.append(f"- Columns: {result.get('column_count', 0)}")
+        parts.append(f"- Delimiter: `{result.get('delimiter', ',')}`\n")
 
-        output += "**Column Schema:**\n\n"
-        output += "| # | Column Name | Type | Nullable | Sample Values |\n"
-        output += "|---|-------------|------|----------|---------------|\n"
+        parts.append("**Column Schema:**\n")
+        parts.append("| # | Column Name | Type | Nullable | Sample Values |")
+        parts.append("|---|-------------|------|----------|---------------|")
 
         for i, col in enumerate(result.get("column_types", [])[:50], 1):
             name = col.get("name", "")[:30]
             col_type = col.get("type", "unknown")
             nullable = "Yes" if col.get("nullable") else "No"
             samples = ", ".join(str(v)[:15] for v in col.get("sample_values", [])[:2])
-            output += f"| {i} | {name} | {col_type} | {nullable} | {samples} |\n"
+            parts.append(f"| {i} | {name} | {col_type} | {nullable} | {samples} |")
 
         if len(result.get("column_types", [])) > 50:
-            output += f"\n*... and {len(result['column_types']) - 50} more columns*\n"
+            parts.append(f"\n*... and {len(result['column_types']) - 50} more columns*")
 
     elif result.get("sheets"):
-        output += f"- Sheets: {len(result.get('sheet_names', []))}\n\n"
+        parts.append(f"- Sheets: {len(result.get('sheet_names', []))}\n")
 
         for sheet_name, sheet_data in result.get("sheets", {}).items():
-            output += f"**Sheet: {sheet_name}**\n"
-            output += f"- Columns: {sheet_data.get('column_count', 0)}\n"
+            parts.append(f"**Sheet: {sheet_name}**")
+            parts.append(f"- Columns: {sheet_data.get('column_count', 0)}")
             headers = sheet_data.get("headers", [])[:10]
-            output += f"- Headers: {', '.join(h for h in headers if h)}\n\n"
+            parts.append(f"- Headers: {', '.join(h for h in headers if h)}\n")
 
-    return output
+    return "\n".join(parts) + "\n"
 
 
 @mcp.tool()
@@ -141,42 +200,57 @@ async def detect_dataset_schemas(
     if not tabular_resources:
         return f"No tabular files ({formats}) found in dataset: {submission.title}"
 
-    output = f"**Schema Detection for: {submission.title}**\n\n"
-    output += f"Found {len(tabular_resources)} tabular file(s)\n\n"
+    # Run the Range-request detections concurrently; the semaphore keeps the
+    # fan-out against the EDX server bounded.
+    semaphore = asyncio.Semaphore(8)
+
+    async def detect(resource):
+        async with semaphore:
+            return await detector.detect_headers(resource.id, resource.format)
+
+    results = await asyncio.gather(
+        *(detect(r) for r in tabular_resources), return_exceptions=True
+    )
+
+    parts = [
+        f"**Schema Detection for: {submission.title}**\n",
+        f"Found {len(tabular_resources)} tabular file(s)\n",
+    ]
 
-    for resource in tabular_resources:
+    for resource, result in zip(tabular_resources, results):
         download_url = edx.get_download_url(resource.id)
-        output += f"---\n\n### {resource.name}\n\n"
-        output += f"- **Resource ID:** `{resource.id}`\n"
-        output += f"- **📥 Download:** {download_url}\n"
+        parts.append(f"---\n\n### {resource.name}\n")
+        parts.append(f"- **Resource ID:** `{resource.id}`")
+        parts.append(f"- **📥 Download:** {download_url}")
 
-        result = await detector.detect_headers(resource.id, resource.format)
+        if isinstance(result, Exception):
+            result = {"success": False, "error": str(result)}
 
         if result.get("success"):
             if "column_count" in result:
-                output += f"- **Columns:** {result['column_count']}\n"
+                parts.append(f"- **Columns:** {result['column_count']}")
                 headers = result.get("headers", [])[:10]
-                output += f"- **Headers:** {', '.join(headers)}"
+                header_line = f"- **Headers:** {', '.join(headers)}"
                 if len(result.get("headers", [])) > 10:
-                    output += f" ... (+{len(result['headers']) - 10} more)"
-                output += "\n"
+                    header_line += f" ... (+{len(result['headers']) - 10} more)"
+                parts.append(header_line)
 
                 # Show column types summary
                 types = {}
                 for col in result.get("column_types", []):
                     t = col.get("type", "unknown")
                     types[t] = types.get(t, 0) + 1
-                output += f"- **Types:** {', '.join(f'{t}: {c}' for t, c in types.items())}\n"
+                parts.append(f"- **Types:** {', '.join(f'{t}: {c}' for t, c in types.items())}")
 
             elif result.get("sheets"):
                 for sheet, data in result.get("sheets", {}).items():
-                    output += f"- **Sheet '{sheet}':** {data.get('column_count', 0)} columns\n"
+                    parts.append(f"- **Sheet '{sheet}':** {data.get('column_count', 0)} columns")
         else:
-            output += f"- **Error:** {result.get('error', 'Unknown')[:50]}\n"
+            parts.append(f"- **Error:** {result.get('error', 'Unknown')[:50]}")
 
-        output += "\n"
+        parts.append("")
 
-    return output
+    return "\n".join(parts) + "\n"
 
 
 @mcp.tool()
@@ -200,20 +274,25 @@ async def search_claimm_data(
     edx = get_edx_client()
     llm = get_llm_client()
 
-    # Interpret the query using LLM
-    interpreted = await llm.interpret_search_query(query)
+    # Interpret the query using LLM; trivial mineral queries skip the
+    # round-trip and search as-is
+    if _is_trivial_query(query):
+        interpreted = {"query": query, "tags": None, "explanation": ""}
+    else:
+        interpreted = await llm.interpret_search_query(query)
 
     # Search EDX - prepend "claimm" to ensure we search CLAIMM data
     search_query = f"claimm {interpreted['query']}"
     results = await edx.search_submissions(
         query=search_query,
         tags=interpreted.get("tags"),
+        format=format_filter,
         limit=max_results,
     )
 
-    # If format filter provided, apply it (override LLM interpretation)
+    # The format filter is pushed into the EDX query above; this pass only
+    # trims each submission's resource list to the matching files.
     if format_filter:
-        # Filter results by format
         filtered = []
         for sub in results:
             matching_resources = [
@@ -232,10 +311,10 @@ async def search_claimm_data(
         summary = f"**Search interpretation:** {interpreted['explanation']}\n\n{summary}"
 
     # Add download URLs section
-    download_section = "\n\n---\n\n**📥 Direct Download Links:**\n\n"
+    download_lines = ["\n\n---\n\n**📥 Direct Download Links:**\n"]
     for i, sub in enumerate(results[:10], 1):  # Limit to top 10 for readability
-        download_section += f"{i}. **{sub.title or sub.name}**\n"
-        download_section += f"   - Dataset ID: `{sub.id}`\n"
+        download_lines.append(f"{i}. **{sub.title or sub.name}**")
+        download_lines.append(f"   - Dataset ID: `{sub.id}`")
 
         # Add links for each resource in the dataset
         if sub.resources:
@@ -244,24 +323,19 @@ async def search_claimm_data(
                 resource = sub.resources[0]
                 download_url = edx.get_download_url(resource.id)
                 format_info = f" ({resource.format})" if resource.format else ""
-                download_section += f"   - Download{format_info}: {download_url}\n"
+                download_lines.append(f"   - Download{format_info}: {download_url}")
             else:
                 # Multiple resources - list them
-                download_section += f"   - Files ({len(sub.resources)}):\n"
+                download_lines.append(f"   - Files ({len(sub.resources)}):")
                 for resource in sub.resources[:5]:  # Limit to first 5 files
-                    download_url = edx.get_download_url(resource.id)
-                    format_info = f" ({resource.format})" if resource.format else ""
-                    file_name = (
-                        resource.name[:50] + "..." if len(resource.name) > 50 else resource.name
+                    download_lines.append(
+                        _resource_line(resource.id, resource.name, resource.format, "     - ", 50)
                     )
-                    download_section += f"     - {file_name}{format_info}: {download_url}\n"
                 if len(sub.resources) > 5:
-                    download_section += f"     - *... and {len(sub.resources) - 5} more files*\n"
-        download_section += "\n"
-
-    summary += download_section
+                    download_lines.append(f"     - *... and {len(sub.resources) - 5} more files*")
+        download_lines.append("")
 
-    return summary
+    return summary + "\n".join(download_lines) + "\n"
 
 
 @mcp.tool()
@@ -295,23 +369,23 @@ async def list_claimm_datasets(
     output_lines = [f"**CLAIMM Datasets** ({len(submissions)} found)\n"]
 
     for sub in submissions:
-        formats = set(r.format for r in sub.resources if r.format)
-        output_lines.append(
+        formats = sub.formats
+        sub_lines = [
             f"- **{sub.title or sub.name}**\n"
             f"  - ID: `{sub.id}`\n"
             f"  - Files: {len(sub.resources)} ({', '.join(formats) if formats else 'unknown formats'})\n"
             f"  - Tags: {', '.join(sub.tags[:5]) if sub.tags else 'None'}"
-        )
+        ]
         # Add download links for resources
         if sub.resources:
             for resource in sub.resources[:3]:  # Show first 3 files
-                download_url = edx.get_download_url(resource.id)
-                format_info = f" ({resource.format})" if resource.format else ""
-                file_name = resource.name[:40] + "..." if len(resource.name) > 40 else resource.name
-                output_lines.append(f"  - 📥 {file_name}{format_info}: {download_url}")
+                sub_lines.append(
+                    _resource_line(resource.id, resource.name, resource.format, "  - 📥 ", 40)
+                )
             if len(sub.resources) > 3:
-                output_lines.append(f"  - *... +{len(sub.resources) - 3} more files*")
-        output_lines.append("")  # Add blank line between datasets
+                sub_lines.append(f"  - *... +{len(sub.resources) - 3} more files*")
+        sub_lines.append("")  # Blank line between datasets
+        output_lines.extend(sub_lines)
 
     return "\n".join(output_lines)
 
@@ -330,8 +404,13 @@ async def get_dataset_details(dataset_id: str) -> str:
     edx = get_edx_client()
 
     submission = await edx.get_submission(dataset_id)
+    return _format_submission(submission, edx)
+
 
-    output = f"""**{submission.title or submission.name}**
+def _format_submission(submission, edx) -> str:
+    """Render the detail block shared by get_dataset_details and batch_dataset_details."""
+    parts = [
+        f"""**{submission.title or submission.name}**
 
 **Description:**
 {submission.notes or "No description available."}
@@ -346,18 +425,21 @@ async def get_dataset_details(dataset_id: str) -> str:
 
 **Resources ({len(submission.resources)} files):**
 """
+    ]
 
     for r in submission.resources:
         size_str = f"{r.size:,} bytes" if r.size else "Unknown size"
-        output += f"""
+        parts.append(
+            f"""
 - **{r.name}**
   - ID: `{r.id}`
   - Format: {r.format or "Unknown"}
   - Size: {size_str}
   - Download: {edx.get_download_url(r.id)}
 """
+        )
 
-    return output
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -374,7 +456,11 @@ async def get_resource_details(resource_id: str) -> str:
     edx = get_edx_client()
 
     resource = await edx.get_resource(resource_id)
+    return _format_resource(resource, edx)
 
+
+def _format_resource(resource, edx) -> str:
+    """Render the detail block shared by get_resource_details and batch_resource_details."""
     size_str = f"{resource.size:,} bytes" if resource.size else "Unknown"
 
     return f"""**{resource.name}**
@@ -394,6 +480,68 @@ async def get_resource_details(resource_id: str) -> str:
 """
 
 
+@mcp.tool()
+async def batch_resource_details(resource_ids: list[str]) -> str:
+    """
+    Get detailed information about multiple resources (files) in one call.
+
+    Fetches all resources concurrently, so asking about 10 files costs one
+    round-trip of latency instead of 10 sequential get_resource_details calls.
+
+    Args:
+        resource_ids: List of resource IDs
+
+    Returns:
+        Detailed information for each resource, in the order requested
+    """
+    edx = get_edx_client()
+
+    resources = await asyncio.gather(
+        *(edx.get_resource(rid) for rid in resource_ids),
+        return_exceptions=True,
+    )
+
+    parts = []
+    for rid, resource in zip(resource_ids, resources):
+        if isinstance(resource, Exception):
+            parts.append(f"**Resource `{rid}`**\n\nError: {resource}\n")
+        else:
+            parts.append(_format_resource(resource, edx))
+
+    return "\n---\n".join(parts)
+
+
+@mcp.tool()
+async def batch_dataset_details(dataset_ids: list[str]) -> str:
+    """
+    Get detailed information about multiple CLAIMM datasets in one call.
+
+    Fetches all datasets concurrently instead of one get_dataset_details
+    round-trip per dataset.
+
+    Args:
+        dataset_ids: List of dataset IDs or names
+
+    Returns:
+        Detailed information for each dataset, in the order requested
+    """
+    edx = get_edx_client()
+
+    submissions = await asyncio.gather(
+        *(edx.get_submission(did) for did in dataset_ids),
+        return_exceptions=True,
+    )
+
+    parts = []
+    for did, submission in zip(dataset_ids, submissions):
+        if isinstance(submission, Exception):
+            parts.append(f"**Dataset `{did}`**\n\nError: {submission}\n")
+        else:
+            parts.append(_format_submission(submission, edx))
+
+    return "\n---\n".join(parts)
+
+
 @mcp.tool()
 async def ask_about_data(
     question: str,
@@ -427,27 +575,38 @@ async def ask_about_data(
 
     if dataset_id:
         submission = await edx.get_submission(dataset_id)
-        # Use the first resource as context if available
-        resource = submission.resources[0] if submission.resources else None
-        if resource:
-            return await llm.answer_about_resource(resource, submission, question)
-        else:
-            # Answer based on submission only
-            try:
-                from .edx_client import Resource
-            except ImportError:
-                from claimm_mcp.edx_client import Resource
-            dummy_resource = Resource(
+        # Use the first resource as context, or a stand-in built from the
+        # submission itself when the dataset has no files
+        resource = (
+            submission.resources[0]
+            if submission.resources
+            else Resource(
                 id=submission.id,
                 name=submission.name,
                 description=submission.notes,
             )
-            return await llm.answer_about_resource(dummy_resource, submission, question)
+        )
+        return await llm.answer_about_resource(resource, submission, question)
 
     # General question - search for relevant data first
     results = await edx.search_submissions(query=f"claimm {question}", limit=5)
     if results:
-        context = "\n".join([f"- {s.title or s.name}: {(s.notes or '')[:200]}" for s in results])
+        # Search can return stub submissions without notes; hydrate those
+        # concurrently instead of paying one round-trip per submission.
+        if any(not s.notes for s in results):
+            semaphore = asyncio.Semaphore(5)
+
+            async def hydrate(sub):
+                if sub.notes:
+                    return sub
+                async with semaphore:
+                    try:
+                        return await edx.get_submission(sub.id)
+                    except (httpx.HTTPError, OSError, KeyError):
+                        return sub
+
+            results = await asyncio.gather(*(hydrate(s) for s in results))
+        context = "\n".join(f"- {s.title or s.name}: {_short_notes(s)}" for s in results)
         return f"""Based on searching CLAIMM for "{question}", here are relevant datasets:
 
 {context}
@@ -91,6 +91,17 @@ CRITICAL_MINERAL_HS_CODES: dict[str, list[str]] = {
     "copper": ["7402", "7403"],  # Refined copper, unrefined copper
 }
 
+# Critical-mineral HS codes bucketed by digit level (2/4/6), built once at
+# import time so per-request filters index a dict instead of re-scanning the
+# mixed-length code lists.
+HS_CODES_BY_LEN: dict[int, tuple[str, ...]] = {}
+_by_len: dict[int, list[str]] = {}
+for _codes in CRITICAL_MINERAL_HS_CODES.values():
+    for _code in _codes:
+        _by_len.setdefault(len(_code), []).append(_code)
+HS_CODES_BY_LEN = {length: tuple(codes) for length, codes in sorted(_by_len.items())}
+del _by_len
+
 # Friendly names for display
 MINERAL_NAMES: dict[str, str] = {
     "lithium": "Lithium (Li)",
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import defaultdict
+from operator import itemgetter
+
 import httpx
 from mcp.server.fastmcp import FastMCP
+from pydantic import TypeAdapter
 
 from .client import ComtradeClient
-from .models import CRITICAL_MINERAL_HS_CODES, MINERAL_NAMES
+from .models import CRITICAL_MINERAL_HS_CODES, MINERAL_NAMES, TradeRecord
+
+# Serializes whole record lists through pydantic's Rust core in one dispatch
+# instead of a per-record model_dump() call.
+_TRADE_LIST_ADAPTER = TypeAdapter(list[TradeRecord])
 
 # Initialize MCP server
 mcp = FastMCP(
@@ -36,6 +46,98 @@ def get_client() -> ComtradeClient:
     return ComtradeClient()
 
 
+# Reference tables (reporters, partners, commodities) change rarely, so
+# repeated tool calls within the TTL are served from memory. Each cache
+# entry also carries a search index (record, lowercased text, id string)
+# and length buckets for HS-level filtering, built once per refresh so the
+# per-call filters run over precomputed strings.
+_REF_CACHE: dict[str, dict] = {}
+_REF_TTL = 3600.0
+
+
+async def _cached_reference(key: str, coro_factory, ttl: float = _REF_TTL) -> dict:
+    """Return the cached reference entry for `key`, refreshing it when stale."""
+    entry = _REF_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry["ts"] < ttl:
+        return entry
+    data = await coro_factory()
+    index = [(rec, rec.get("text", "").lower(), str(rec.get("id", ""))) for rec in data]
+    by_len: dict[int, list] = {}
+    for item in index:
+        by_len.setdefault(len(item[2]), []).append(item)
+    entry = {"ts": time.monotonic(), "data": data, "index": index, "by_len": by_len}
+    _REF_CACHE[key] = entry
+    return entry
+
+
+# Published trade data is effectively immutable for a given year, so
+# identical queries within the TTL are served from memory instead of
+# re-hitting the Comtrade API.
+_TRADE_CACHE: dict[tuple, tuple[float, list]] = {}
+_TRADE_TTL = 3600.0
+_TRADE_CACHE_MAX = 2048
+
+
+async def _cached_trade(
+    client: ComtradeClient,
+    *,
+    reporter: str,
+    partner: str,
+    commodity: str,
+    flow: str,
+    period: str,
+    max_records: int,
+) -> list:
+    """get_trade_data with a TTL cache keyed on the full argument tuple."""
+    key = (reporter, partner, commodity, flow, period, max_records)
+    entry = _TRADE_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _TRADE_TTL:
+        return entry[1]
+
+    records = await client.get_trade_data(
+        reporter=reporter,
+        partner=partner,
+        commodity=commodity,
+        flow=flow,
+        period=period,
+        max_records=max_records,
+    )
+
+    if len(_TRADE_CACHE) >= _TRADE_CACHE_MAX:
+        now = time.monotonic()
+        for stale in [k for k, v in _TRADE_CACHE.items() if now - v[0] >= _TRADE_TTL]:
+            del _TRADE_CACHE[stale]
+        if len(_TRADE_CACHE) >= _TRADE_CACHE_MAX:
+            _TRADE_CACHE.clear()
+    _TRADE_CACHE[key] = (time.monotonic(), records)
+    return records
+
+
+# Reverse lookup from HS code to mineral key, built once so multi-commodity
+# query results can be grouped back to minerals in a single pass.
+_CODE_TO_MINERAL = {
+    code: mineral for mineral, codes in CRITICAL_MINERAL_HS_CODES.items() for code in codes
+}
+
+# Comma-joined cmdCode parameter values for the profile queries (chunks of 20
+# codes), precomputed so each request looks them up instead of re-joining the
+# code lists.
+_ALL_MINERAL_CODES = list(_CODE_TO_MINERAL)
+_PROFILE_CODE_CHUNKS: tuple[str, ...] = tuple(
+    ",".join(_ALL_MINERAL_CODES[i : i + 20]) for i in range(0, len(_ALL_MINERAL_CODES), 20)
+)
+
+# Built once at import time; both source dicts are module constants.
+_CRITICAL_MINERAL_PAYLOAD = {
+    "count": len(CRITICAL_MINERAL_HS_CODES),
+    "minerals": [
+        {"id": key, "name": MINERAL_NAMES.get(key, key), "hs_codes": codes}
+        for key, codes in CRITICAL_MINERAL_HS_CODES.items()
+    ],
+    "usage": "Use get_critical_mineral_trade(mineral='lithium', ...) to query",
+}
+
+
 # =============================================================================
 # Overview Tools
 # =============================================================================
@@ -60,20 +162,7 @@ async def list_critical_minerals() -> dict:
     Returns the pre-configured critical minerals and their associated
     HS commodity codes for easy querying.
     """
-    minerals = []
-    for key, codes in CRITICAL_MINERAL_HS_CODES.items():
-        minerals.append(
-            {
-                "id": key,
-                "name": MINERAL_NAMES.get(key, key),
-                "hs_codes": codes,
-            }
-        )
-    return {
-        "count": len(minerals),
-        "minerals": minerals,
-        "usage": "Use get_critical_mineral_trade(mineral='lithium', ...) to query",
-    }
+    return _CRITICAL_MINERAL_PAYLOAD
 
 
 @mcp.tool()
@@ -89,11 +178,13 @@ async def list_reporters(search: str | None = None, limit: int = 50) -> dict:
         List of reporter countries with their codes
     """
     client = get_client()
-    reporters = await client.get_reporters()
+    entry = await _cached_reference("reporters", client.get_reporters)
 
     if search:
         search_lower = search.lower()
-        reporters = [r for r in reporters if search_lower in r.get("text", "").lower()]
+        reporters = [rec for rec, text, _ in entry["index"] if search_lower in text]
+    else:
+        reporters = entry["data"]
 
     reporters = reporters[:limit]
     return {
@@ -116,11 +207,13 @@ async def list_partners(search: str | None = None, limit: int = 50) -> dict:
         List of partner areas with their codes
     """
     client = get_client()
-    partners = await client.get_partners()
+    entry = await _cached_reference("partners", client.get_partners)
 
     if search:
         search_lower = search.lower()
-        partners = [p for p in partners if search_lower in p.get("text", "").lower()]
+        partners = [rec for rec, text, _ in entry["index"] if search_lower in text]
+    else:
+        partners = entry["data"]
 
     partners = partners[:limit]
     return {
@@ -148,21 +241,21 @@ async def list_commodities(
         List of commodity codes with descriptions
     """
     client = get_client()
-    commodities = await client.get_commodities()
+    entry = await _cached_reference("commodities", client.get_commodities)
 
-    # Filter by HS level (code length)
+    # Filter by HS level (code length) via the precomputed buckets
     if hs_level in [2, 4, 6]:
-        commodities = [c for c in commodities if len(str(c.get("id", ""))) == hs_level]
+        candidates = entry["by_len"].get(hs_level, [])
+    else:
+        candidates = entry["index"]
 
     if search:
         search_lower = search.lower()
-        commodities = [
-            c
-            for c in commodities
-            if search_lower in c.get("text", "").lower() or search_lower in str(c.get("id", ""))
+        candidates = [
+            item for item in candidates if search_lower in item[1] or search_lower in item[2]
         ]
 
-    commodities = commodities[:limit]
+    commodities = [rec for rec, _, _ in candidates[:limit]]
     return {
         "count": len(commodities),
         "commodities": commodities,
@@ -199,7 +292,8 @@ async def get_trade_data(
         Trade records with values in USD and quantities
     """
     client = get_client()
-    records = await client.get_trade_data(
+    records = await _cached_trade(
+        client,
         reporter=reporter,
         partner=partner,
         commodity=commodity,
@@ -217,7 +311,7 @@ async def get_trade_data(
             "flow": flow,
             "year": year,
         },
-        "records": [r.model_dump() for r in records],
+        "records": _TRADE_LIST_ADAPTER.dump_python(records),
     }
 
 
@@ -247,6 +341,15 @@ async def get_critical_mineral_trade(
     Returns:
         Trade records for the specified mineral
     """
+    # Reject unknown minerals before any client work
+    mineral_lower = mineral.lower().replace(" ", "_")
+    hs_codes = CRITICAL_MINERAL_HS_CODES.get(mineral_lower)
+    if not hs_codes:
+        return {
+            "error": f"Unknown mineral: {mineral}",
+            "available": list(CRITICAL_MINERAL_HS_CODES),
+        }
+
     client = get_client()
 
     try:
@@ -261,9 +364,6 @@ async def get_critical_mineral_trade(
     except ValueError as e:
         return {"error": str(e)}
 
-    mineral_lower = mineral.lower().replace(" ", "_")
-    hs_codes = CRITICAL_MINERAL_HS_CODES.get(mineral_lower, [])
-
     return {
         "count": len(records),
         "mineral": MINERAL_NAMES.get(mineral_lower, mineral),
@@ -274,7 +374,7 @@ async def get_critical_mineral_trade(
             "flow": flow,
             "year": year,
         },
-        "records": [r.model_dump() for r in records],
+        "records": _TRADE_LIST_ADAPTER.dump_python(records),
     }
 
 
@@ -300,10 +400,9 @@ async def get_commodity_trade_summary(
         Markdown-formatted summary table
     """
     client = get_client()
-    import asyncio
 
-    # Query each reporter
-    country_totals: dict[str, float] = {}
+    # Query each reporter and accumulate totals in a single pass
+    country_totals: defaultdict[str, float] = defaultdict(float)
     commodity_name = None
 
     reporter_list = [r.strip() for r in reporters.split(",")]
@@ -311,7 +410,8 @@ async def get_commodity_trade_summary(
     for reporter in reporter_list:
         try:
             await asyncio.sleep(0.3)  # Rate limit
-            records = await client.get_trade_data(
+            records = await _cached_trade(
+                client,
                 reporter=reporter,
                 partner="0",  # World
                 commodity=commodity,
@@ -320,9 +420,9 @@ async def get_commodity_trade_summary(
                 max_records=10,
             )
             for r in records:
-                if r.trade_value:
-                    country = r.reporter_name
-                    country_totals[country] = country_totals.get(country, 0) + r.trade_value
+                value = r.trade_value
+                if value:
+                    country_totals[r.reporter_name] += value
                     if commodity_name is None:
                         commodity_name = r.commodity
         except (httpx.HTTPError, OSError, ValueError):
@@ -331,24 +431,26 @@ async def get_commodity_trade_summary(
     if not country_totals:
         return f"No {flow} data found for commodity {commodity} in {year}"
 
-    # Sort by value
-    sorted_countries = sorted(country_totals.items(), key=lambda x: x[1], reverse=True)
+    # Sort by value; itemgetter keeps the key extraction in C
+    sorted_countries = sorted(country_totals.items(), key=itemgetter(1), reverse=True)
 
     total = sum(v for _, v in sorted_countries)
     flow_name = "Imports" if flow == "M" else "Exports"
 
-    # Format as markdown table
-    output = f"**{commodity_name or commodity} - {flow_name} ({year})**\n\n"
-    output += "| Rank | Country | Value (USD) | Share |\n"
-    output += "|------|---------|-------------|-------|\n"
+    # Format as markdown table, joined once at the end
+    lines = [
+        f"**{commodity_name or commodity} - {flow_name} ({year})**\n",
+        "| Rank | Country | Value (USD) | Share |",
+        "|------|---------|-------------|-------|",
+    ]
 
     for i, (country, value) in enumerate(sorted_countries, 1):
         share = (value / total * 100) if total > 0 else 0
-        output += f"| {i} | {country} | ${value:,.0f} | {share:.1f}% |\n"
+        lines.append(f"| {i} | {country} | ${value:,.0f} | {share:.1f}% |")
 
-    output += f"\n**Total: ${total:,.0f}**\n"
+    lines.append(f"\n**Total: ${total:,.0f}**\n")
 
-    return output
+    return "\n".join(lines)
 
 
 @mcp.tool()
@@ -368,8 +470,6 @@ async def get_country_trade_profile(
     Returns:
         Summary of country's trade in critical minerals
     """
-    import asyncio
-
     client = get_client()
     profile = {
         "country_code": country,
@@ -379,31 +479,46 @@ async def get_country_trade_profile(
     }
 
     if commodity_type == "critical_minerals":
-        for mineral, hs_codes in CRITICAL_MINERAL_HS_CODES.items():
-            commodity = ",".join(hs_codes)
-
-            try:
-                await asyncio.sleep(0.3)  # Rate limit
-                # Get imports and exports in one query
-                records = await client.get_trade_data(
+        # All minerals' HS codes go into a few multi-commodity flow="M,X"
+        # queries (cmdCode accepts a comma-separated list) instead of one
+        # request per mineral; records are grouped back to minerals through
+        # _CODE_TO_MINERAL in a single pass. The precomputed chunks keep the
+        # cmdCode parameter well under Comtrade's limits, and the semaphore
+        # holds in-flight chunks under Comtrade's per-minute cap if the code
+        # list ever grows to many chunks.
+        semaphore = asyncio.Semaphore(4)
+
+        async def fetch(commodity: str):
+            async with semaphore:
+                return await _cached_trade(
+                    client,
                     reporter=country,
                     partner="0",
                     commodity=commodity,
                     flow="M,X",
                     period=year,
-                    max_records=50,
+                    max_records=500,
                 )
 
-                import_total = sum(r.trade_value or 0 for r in records if r.flow_code == "M")
-                export_total = sum(r.trade_value or 0 for r in records if r.flow_code == "X")
+        results = await asyncio.gather(
+            *(fetch(c) for c in _PROFILE_CODE_CHUNKS), return_exceptions=True
+        )
 
-                mineral_name = MINERAL_NAMES.get(mineral, mineral)
-                if import_total > 0:
-                    profile["imports"][mineral_name] = import_total
-                if export_total > 0:
-                    profile["exports"][mineral_name] = export_total
-            except (httpx.HTTPError, OSError, ValueError):
+        for records in results:
+            if isinstance(records, Exception):
                 continue
+            for r in records:
+                mineral = _CODE_TO_MINERAL.get(r.commodity_code)
+                if mineral is None or not r.trade_value:
+                    continue
+                mineral_name = MINERAL_NAMES.get(mineral, mineral)
+                if r.flow_code == "M":
+                    bucket = profile["imports"]
+                elif r.flow_code == "X":
+                    bucket = profile["exports"]
+                else:
+                    continue
+                bucket[mineral_name] = bucket.get(mineral_name, 0) + r.trade_value
 
     profile["total_imports"] = sum(profile["imports"].values())
     profile["total_exports"] = sum(profile["exports"].values())
@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 import os
 
 import httpx
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv, find_dotenv
 
 from .mrds_client import MRDSClient
 from .osm_client import search_osm_mines
 from .usgs_client import USGSMCSClient
 
+# Cached so /qa doesn't re-read ~8 environment variables per request; the
+# startup hook clears and re-warms it after dotenv loading so env overrides
+# still apply.
+@lru_cache(maxsize=1)
 def _get_llm_config() -> dict[str, str]:
     provider = (os.environ.get("LLM_PROVIDER") or "openai").lower()
     if provider == "anthropic":
@@ -65,17 +74,39 @@ async def _call_llm(question: str, context: dict[str, Any] | None) -> tuple[str,
         "temperature": 0.2,
     }
 
-    headers = {"Authorization": f"Bearer {cfg['api_key']}"}
+    headers = {
+        "Authorization": f"Bearer {cfg['api_key']}",
+        "Content-Type": "application/json",
+    }
     url = cfg["base_url"].rstrip("/") + "/chat/completions"
-    async with httpx.AsyncClient(timeout=60) as client:
-        resp = await client.post(url, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            raise HTTPException(status_code=502, detail=f"LLM error: {resp.text}")
-        data = resp.json()
+    client = _get_httpx()
+    # Serialize once with orjson instead of letting httpx run stdlib json
+    # over a potentially large context dict.
+    resp = await client.post(url, content=orjson.dumps(payload), headers=headers)
+    if resp.status_code >= 400:
+        raise HTTPException(status_code=502, detail=f"LLM error: {resp.text}")
+    data = orjson.loads(resp.content)
 
     answer = data["choices"][0]["message"]["content"]
     return answer, cfg["model"], cfg["provider"]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the heavy dataframes in worker threads before serving, so the
+    # first request never pays the CSV parse inside a handler, then close
+    # the shared httpx pool on the way out.
+    await asyncio.to_thread(get_client()._load_dataframe)
+    await asyncio.to_thread(_get_mrds()._load_dataframe)
+    _get_httpx()
+    _get_llm_config.cache_clear()
+    _get_llm_config()
+    yield
+    global _HTTPX
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+        _HTTPX = None
+
+
 app = FastAPI(
     title="USGS Mineral Commodity Summaries API",
     description=(
@@ -85,21 +116,71 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson serializes several times faster than stdlib json on the
+    # record-heavy ranking/profile payloads.
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# The CORS policy is fixed (any origin, read-mostly API), so a slim
+# middleware stamping precomputed headers replaces CORSMiddleware's
+# per-request header parsing and preflight machinery.
+_CORS_HEADERS = {
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Allow-Methods": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
+
+@app.middleware("http")
+async def _cors(request: Request, call_next):
+    origin = request.headers.get("origin")
+    if request.method == "OPTIONS" and origin:
+        headers = dict(_CORS_HEADERS)
+        headers["Access-Control-Allow-Origin"] = origin
+        headers["Access-Control-Max-Age"] = "600"
+        return Response(status_code=204, headers=headers)
+    response = await call_next(request)
+    if origin:
+        response.headers.update(_CORS_HEADERS)
+        response.headers["Access-Control-Allow-Origin"] = origin
+        response.headers["Vary"] = "Origin"
+    return response
 
 load_dotenv(find_dotenv(), override=True)
 
+# Process-wide singletons: the MCS client holds the parsed release data, the
+# MRDS client its site index, and the shared httpx client a warm connection
+# pool for LLM calls. All are created once at startup instead of per request.
+_USGS: USGSMCSClient | None = None
+_MRDS: MRDSClient | None = None
+_HTTPX: httpx.AsyncClient | None = None
+
 
 def get_client() -> USGSMCSClient:
-    return USGSMCSClient()
+    global _USGS
+    if _USGS is None:
+        _USGS = USGSMCSClient()
+    return _USGS
+
+
+def _get_mrds() -> MRDSClient:
+    global _MRDS
+    if _MRDS is None:
+        _MRDS = MRDSClient()
+    return _MRDS
+
+
+def _get_httpx() -> httpx.AsyncClient:
+    global _HTTPX
+    if _HTTPX is None:
+        # Keep-alive pool plus HTTP/2 multiplexing for concurrent /qa load.
+        _HTTPX = httpx.AsyncClient(
+            timeout=60,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _HTTPX
 
 
 class CommodityList(BaseModel):
@@ -112,7 +193,13 @@ class CountryList(BaseModel):
     countries: list[str]
 
 
+# The per-row models below are instantiated once per list element during
+# response validation, so they carry a lean config: frozen models get
+# optimized pydantic-core validators and unknown keys are dropped instead
+# of stored.
 class RankedCountry(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     rank: int
     country: str
     quantity: float
@@ -129,6 +216,8 @@ class RankingResponse(BaseModel):
 
 
 class TimeSeriesPoint(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     year: int
     quantity: float
 
@@ -142,6 +231,8 @@ class TimeSeriesResponse(BaseModel):
 
 
 class CountryCommodity(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     commodity: str
     quantity: float
     units: str | None
@@ -166,6 +257,8 @@ class QAResponse(BaseModel):
 
 
 class MinePoint(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     name: str
     lat: float
     lng: float
@@ -192,64 +285,125 @@ async def root() -> dict[str, Any]:
     }
 
 
+# MCS data is static per release, so these payloads are cacheable both
+# in-process and by clients: responses carry an ETag plus Cache-Control and
+# conditional requests get a 304 without reserializing.
+_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+
+
+def _etag_response(request: Request, payload: Any, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(content=payload, headers=headers)
+
+
+def _payload_etag(payload: Any) -> str:
+    return hashlib.md5(orjson.dumps(payload)).hexdigest()
+
+
+# The commodity/country lists come from the static MCS release data, so they
+# are computed once per process instead of on every request.
+@lru_cache(maxsize=1)
+def _commodities_payload() -> tuple[dict[str, Any], str]:
+    commodities = get_client().list_commodities()
+    payload = {"total": len(commodities), "commodities": commodities}
+    return payload, _payload_etag(payload)
+
+
+@lru_cache(maxsize=1)
+def _countries_payload() -> tuple[dict[str, Any], str]:
+    countries = get_client().list_countries()
+    payload = {"total": len(countries), "countries": countries}
+    return payload, _payload_etag(payload)
+
+
+# Parameterized queries against the static release data are memoized the
+# same way, keyed on the query arguments. Errors propagate uncached.
+@lru_cache(maxsize=512)
+def _ranking_payload(
+    commodity: str, year: int | None, statistic_type: str, top_n: int
+) -> tuple[dict[str, Any], str]:
+    payload = get_client().get_country_ranking(
+        commodity=commodity, year=year, statistic_type=statistic_type, top_n=top_n
+    )
+    return payload, _payload_etag(payload)
+
+
+@lru_cache(maxsize=512)
+def _timeseries_payload(
+    commodity: str, country: str | None, statistic_type: str
+) -> tuple[dict[str, Any], str]:
+    payload = get_client().get_time_series(
+        commodity=commodity, country=country, statistic_type=statistic_type
+    )
+    return payload, _payload_etag(payload)
+
+
+@lru_cache(maxsize=512)
+def _profile_payload(
+    country: str, year: int | None, statistic_type: str, limit: int
+) -> tuple[dict[str, Any], str]:
+    payload = get_client().get_country_profile(
+        country=country, year=year, statistic_type=statistic_type, limit=limit
+    )
+    return payload, _payload_etag(payload)
+
+
 @app.get("/commodities", response_model=CommodityList, tags=["Commodities"])
-async def list_commodities():
-    client = get_client()
-    commodities = client.list_commodities()
-    return CommodityList(total=len(commodities), commodities=commodities)
+async def list_commodities(request: Request):
+    payload, etag = _commodities_payload()
+    return _etag_response(request, payload, etag)
 
 
 @app.get("/countries", response_model=CountryList, tags=["Countries"])
-async def list_countries():
-    client = get_client()
-    countries = client.list_countries()
-    return CountryList(total=len(countries), countries=countries)
+async def list_countries(request: Request):
+    payload, etag = _countries_payload()
+    return _etag_response(request, payload, etag)
 
 
 @app.get("/production/ranking", response_model=RankingResponse, tags=["Production"])
 async def get_commodity_ranking(
+    request: Request,
     commodity: str = Query(..., description="Commodity name"),
     year: int | None = Query(None, description="Year (defaults to most recent)"),
     statistic_type: str = Query("Production", description="Statistic type"),
     top_n: int = Query(10, description="Number of top countries to return"),
 ):
-    client = get_client()
     try:
-        return client.get_country_ranking(
-            commodity=commodity,
-            year=year,
-            statistic_type=statistic_type,
-            top_n=top_n,
-        )
+        payload, etag = _ranking_payload(commodity, year, statistic_type, top_n)
     except RuntimeError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _etag_response(request, payload, etag)
 
 
 @app.get("/production/timeseries", response_model=TimeSeriesResponse, tags=["Production"])
 async def get_time_series(
+    request: Request,
     commodity: str = Query(..., description="Commodity name"),
     country: str | None = Query(None, description="Country name (optional)"),
     statistic_type: str = Query("Production", description="Statistic type"),
 ):
-    client = get_client()
     try:
-        return client.get_time_series(commodity=commodity, country=country, statistic_type=statistic_type)
+        payload, etag = _timeseries_payload(commodity, country, statistic_type)
     except RuntimeError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _etag_response(request, payload, etag)
 
 
 @app.get("/countries/{country}/profile", response_model=CountryProfile, tags=["Countries"])
 async def get_country_profile(
+    request: Request,
     country: str,
     year: int | None = Query(None, description="Year (defaults to most recent)"),
     statistic_type: str = Query("Production", description="Statistic type"),
     limit: int = Query(20, description="Max commodities to return"),
 ):
-    client = get_client()
     try:
-        return client.get_country_profile(country=country, year=year, statistic_type=statistic_type, limit=limit)
+        payload, etag = _profile_payload(country, year, statistic_type, limit)
     except RuntimeError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _etag_response(request, payload, etag)
 
 
 @app.get("/mines/search", response_model=list[MinePoint], tags=["Mines"])
@@ -259,46 +413,63 @@ async def search_mines(
     limit: int = Query(200, description="Max points to return"),
     source: str = Query("mrds", description="mrds, osm, or both"),
 ):
-    results: list[dict[str, Any]] = []
     normalized_commodity = None
     if commodity:
         normalized_commodity = commodity.split(",")[0].strip()
 
-    if source in {"mrds", "both"}:
-        try:
-            results.extend(
-                MRDSClient().search(
-                    commodity=normalized_commodity, country=country, limit=limit
+    async def fetch_sources(commodity_filter: str | None) -> list[dict[str, Any]]:
+        # MRDS and Overpass are independent; dispatch both at once so
+        # source="both" costs the slower of the two instead of their sum.
+        # The sync clients run in worker threads.
+        tasks = []
+        labels = []
+        if source in {"mrds", "both"}:
+            tasks.append(
+                asyncio.to_thread(
+                    _get_mrds().search,
+                    commodity=commodity_filter,
+                    country=country,
+                    limit=limit,
                 )
             )
-        except RuntimeError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-    if source in {"osm", "both"} and country:
-        try:
-            results.extend(
-                search_osm_mines(country=country, commodity=normalized_commodity, limit=limit)
-            )
-        except httpx.HTTPError:
-            # Overpass can be slow/unavailable; proceed with MRDS-only results.
-            if source == "osm":
-                raise HTTPException(
-                    status_code=502,
-                    detail="Overpass API unavailable (timeout). Try again or use source=mrds.",
-                )
-
-    # Fallback: if filtering was too strict, retry without commodity
-    if not results and normalized_commodity:
-        if source in {"mrds", "both"}:
-            results.extend(MRDSClient().search(commodity=None, country=country, limit=limit))
+            labels.append("mrds")
         if source in {"osm", "both"} and country:
-            try:
-                results.extend(search_osm_mines(country=country, commodity=None, limit=limit))
-            except httpx.HTTPError:
+            tasks.append(
+                asyncio.to_thread(
+                    search_osm_mines,
+                    country=country,
+                    commodity=commodity_filter,
+                    limit=limit,
+                )
+            )
+            labels.append("osm")
+
+        fetched = await asyncio.gather(*tasks, return_exceptions=True)
+        combined: list[dict[str, Any]] = []
+        for label, res in zip(labels, fetched):
+            if isinstance(res, RuntimeError) and label == "mrds":
+                raise HTTPException(status_code=400, detail=str(res))
+            if isinstance(res, httpx.HTTPError) and label == "osm":
+                # Overpass can be slow/unavailable; proceed with MRDS-only results.
                 if source == "osm":
                     raise HTTPException(
                         status_code=502,
                         detail="Overpass API unavailable (timeout). Try again or use source=mrds.",
                     )
+                continue
+            if isinstance(res, BaseException):
+                raise res
+            combined.extend(res)
+        return combined
+
+    results = await fetch_sources(normalized_commodity)
+
+    # Fallback: only when the commodity filter produced nothing, retry the
+    # same sources unfiltered. Unfiltered searches never re-run when the
+    # first pass returned rows, and both passes share the process-wide
+    # MRDS client so the dataset loads at most once.
+    if not results and normalized_commodity:
+        results = await fetch_sources(None)
 
     return results[:limit]
 
@@ -310,51 +481,63 @@ class OpenAIFunction(BaseModel):
     parameters: dict[str, Any]
 
 
-@app.get("/openai/functions", response_model=list[OpenAIFunction], tags=["LLM Integration"])
-async def get_openai_functions():
-    return [
-        OpenAIFunction(
-            name="get_usgs_top_producers",
-            description="Get top producing countries for a USGS MCS commodity",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "commodity": {"type": "string"},
-                    "year": {"type": "integer"},
-                    "statistic_type": {"type": "string"},
-                    "top_n": {"type": "integer"},
-                },
-                "required": ["commodity"],
+# Built and dumped once at import; the handler returns the cached payload
+# without re-validating the models per request.
+_OPENAI_FUNCTIONS: list[OpenAIFunction] = [
+    OpenAIFunction(
+        name="get_usgs_top_producers",
+        description="Get top producing countries for a USGS MCS commodity",
+        parameters={
+            "type": "object",
+            "properties": {
+                "commodity": {"type": "string"},
+                "year": {"type": "integer"},
+                "statistic_type": {"type": "string"},
+                "top_n": {"type": "integer"},
             },
-        ),
-        OpenAIFunction(
-            name="get_usgs_time_series",
-            description="Get time series for a USGS MCS commodity",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "commodity": {"type": "string"},
-                    "country": {"type": "string"},
-                    "statistic_type": {"type": "string"},
-                },
-                "required": ["commodity"],
+            "required": ["commodity"],
+        },
+    ),
+    OpenAIFunction(
+        name="get_usgs_time_series",
+        description="Get time series for a USGS MCS commodity",
+        parameters={
+            "type": "object",
+            "properties": {
+                "commodity": {"type": "string"},
+                "country": {"type": "string"},
+                "statistic_type": {"type": "string"},
             },
-        ),
-        OpenAIFunction(
-            name="get_usgs_country_profile",
-            description="Get commodity profile for a country in USGS MCS data",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "country": {"type": "string"},
-                    "year": {"type": "integer"},
-                    "statistic_type": {"type": "string"},
-                    "limit": {"type": "integer"},
-                },
-                "required": ["country"],
+            "required": ["commodity"],
+        },
+    ),
+    OpenAIFunction(
+        name="get_usgs_country_profile",
+        description="Get commodity profile for a country in USGS MCS data",
+        parameters={
+            "type": "object",
+            "properties": {
+                "country": {"type": "string"},
+                "year": {"type": "integer"},
+                "statistic_type": {"type": "string"},
+                "limit": {"type": "integer"},
             },
-        ),
-    ]
+            "required": ["country"],
+        },
+    ),
+]
+
+_OPENAI_FUNCTIONS_DUMP = [f.model_dump() for f in _OPENAI_FUNCTIONS]
+_OPENAI_FUNCTIONS_ETAG = _payload_etag(_OPENAI_FUNCTIONS_DUMP)
+
+
+@app.get(
+    "/openai/functions",
+    tags=["LLM Integration"],
+    responses={200: {"model": list[OpenAIFunction]}},
+)
+async def get_openai_functions(request: Request):
+    return _etag_response(request, _OPENAI_FUNCTIONS_DUMP, _OPENAI_FUNCTIONS_ETAG)
 
 
 @app.post("/qa", response_model=QAResponse, tags=["LLM"])
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import os
+import shutil
 import zipfile
 from dataclasses import dataclass
+from functools import reduce
 from pathlib import Path
 from typing import Any
 
 import httpx
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 MRDS_ZIP_URL = "https://mrdata.usgs.gov/mrds/mrds-csv.zip"
 
@@ -48,9 +54,24 @@ class MRDSColumns:
 
 
 class MRDSClient:
-    def __init__(self) -> None:
+    def __init__(self, chunked: bool = False, chunk_size: int = 500_000) -> None:
+        """MRDS point-data client.
+
+        When ``chunked`` is set, the initial CSV-to-Parquet conversion
+        streams the file in ``chunk_size``-row pieces through a
+        ParquetWriter instead of materializing the full frame — meant for
+        memory-capped deployments. It trades some wall time for a flat
+        ingest footprint, and the data is only addressable once the
+        Parquet file is complete.
+        """
+        self.chunked = chunked
+        self.chunk_size = chunk_size
         self._df: pd.DataFrame | None = None
         self._cols: MRDSColumns | None = None
+        self._country_index: dict[str, np.ndarray] = {}
+        # Commodity queries repeat heavily (a handful of critical minerals),
+        # so the boolean match masks are memoized per needle.
+        self._commodity_masks: dict[str, np.ndarray] = {}
 
     def _download_zip(self) -> Path:
         cache = _cache_dir() / "mrds"
@@ -59,10 +80,14 @@ class MRDSClient:
         if dest.exists():
             return dest
 
+        # Stream straight to disk; the zip runs to hundreds of MB and
+        # buffering the whole body in memory doubles bootstrap RSS.
         with httpx.Client(timeout=120) as client:
-            resp = client.get(MRDS_ZIP_URL)
-            resp.raise_for_status()
-            dest.write_bytes(resp.content)
+            with client.stream("GET", MRDS_ZIP_URL) as resp:
+                resp.raise_for_status()
+                with open(dest, "wb") as f:
+                    for chunk in resp.iter_bytes(chunk_size=1 << 20):
+                        f.write(chunk)
         return dest
 
     def _extract_csv(self, zip_path: Path) -> Path:
@@ -74,23 +99,157 @@ class MRDSClient:
             csv_name = csv_names[0]
             out = cache / csv_name
             if not out.exists():
-                zf.extract(csv_name, cache)
+                # Decompress through a fixed-size buffer rather than
+                # zf.extract, which buffers far more aggressively.
+                with zf.open(csv_name) as src, open(out, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
             return out
 
+    def _parquet_path(self) -> Path:
+        return _cache_dir() / "mrds" / "mrds.parquet"
+
+    @staticmethod
+    def _keep_columns(cols: MRDSColumns) -> list[str]:
+        return [
+            c
+            for c in (cols.latitude, cols.longitude, cols.country, cols.site_name)
+            if c
+        ] + cols.commodity_fields
+
+    def _build_parquet_chunked(self, csv_path: Path, parquet_path: Path) -> None:
+        # Stream the CSV into Parquet row groups without ever holding the
+        # full frame; peak memory is bounded by one chunk.
+        writer: pq.ParquetWriter | None = None
+        keep: list[str] | None = None
+        try:
+            for chunk in pd.read_csv(
+                csv_path, chunksize=self.chunk_size, dtype_backend="pyarrow"
+            ):
+                chunk.columns = [_normalize(c) for c in chunk.columns]
+                if keep is None:
+                    keep = self._keep_columns(self._infer_columns(list(chunk.columns)))
+                table = pa.Table.from_pandas(chunk[keep], preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        parquet_path,
+                        table.schema,
+                        compression="zstd",
+                        compression_level=3,
+                        use_dictionary=True,
+                        data_page_size=1 << 20,
+                    )
+                elif table.schema != writer.schema:
+                    # Per-chunk type inference can drift (e.g. int vs float);
+                    # pin every row group to the first chunk's schema.
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
     def _load_dataframe(self) -> pd.DataFrame:
         if self._df is not None:
             return self._df
 
-        zip_path = self._download_zip()
-        csv_path = self._extract_csv(zip_path)
-        df = pd.read_csv(csv_path, low_memory=False)
-        df.columns = [_normalize(c) for c in df.columns]
+        # Cold starts after the first read a column-pruned Parquet copy,
+        # memory-mapped so pages are demand-loaded by the kernel, instead
+        # of re-tokenizing the full MRDS CSV.
+        parquet_path = self._parquet_path()
+        if not parquet_path.exists() and self.chunked:
+            csv_path = self._extract_csv(self._download_zip())
+            self._build_parquet_chunked(csv_path, parquet_path)
+        if parquet_path.exists():
+            # Projection pushdown: infer the column map from the file schema
+            # and decode only the columns search uses, so even a cache
+            # written with a wider schema costs nothing extra to load.
+            cols = self._infer_columns(pq.read_schema(parquet_path).names)
+            keep = self._keep_columns(cols)
+            df = pq.read_table(parquet_path, columns=keep, memory_map=True).to_pandas(
+                self_destruct=True, types_mapper=pd.ArrowDtype
+            )
+        else:
+            zip_path = self._download_zip()
+            csv_path = self._extract_csv(zip_path)
+            # Arrow reads the CSV in parallel blocks straight into columnar
+            # buffers — much faster than pandas' single-threaded parser and
+            # without the Python-object intermediate. Column names vary by
+            # release, so the schema stays inferred (same as usgs_client).
+            read_options = pacsv.ReadOptions(block_size=8 << 20)
+            try:
+                table = pacsv.read_csv(csv_path, read_options=read_options)
+            except (pa.ArrowInvalid, UnicodeDecodeError):
+                table = pacsv.read_csv(
+                    csv_path,
+                    read_options=pacsv.ReadOptions(block_size=8 << 20, encoding="cp1252"),
+                )
+            df = table.to_pandas(
+                self_destruct=True, split_blocks=True, types_mapper=pd.ArrowDtype
+            )
+            df.columns = [_normalize(c) for c in df.columns]
+            cols = self._infer_columns(list(df.columns))
+            df = df[self._keep_columns(cols)]
+            # Zstd level 3 plus dictionary pages: country/commodity strings
+            # repeat heavily, so cold-start reads move far fewer bytes for
+            # negligible decode CPU.
+            pq.write_table(
+                pa.Table.from_pandas(df, preserve_index=False),
+                parquet_path,
+                compression="zstd",
+                compression_level=3,
+                use_dictionary=True,
+                data_page_size=1 << 20,
+            )
+
+        cols = self._infer_columns(list(df.columns))
+
+        # The data is immutable for the life of the process, so the search
+        # columns derived from it are computed once here instead of on
+        # every request: numeric float32 coordinates plus a validity mask,
+        # a lowercase commodity blob and lowercase country.
+        for coord in (cols.latitude, cols.longitude):
+            df[coord] = pd.to_numeric(df[coord], errors="coerce").astype("float32")
+        df["_has_coords"] = (
+            df[cols.latitude].notna() & df[cols.longitude].notna()
+        ).to_numpy(dtype=bool)
+        df["_commodity_blob_lc"] = (
+            reduce(
+                lambda a, b: a + " ; " + b,
+                [df[c].fillna("").astype(str) for c in cols.commodity_fields],
+            )
+            .str.lower()
+            .astype("string[pyarrow]")
+        )
+        if cols.country:
+            df["_country_lc"] = (
+                df[cols.country].fillna("").astype(str).str.lower().astype("string[pyarrow]")
+            )
+            self._country_index = self._build_country_index(df["_country_lc"])
+
         self._df = df
-        self._cols = self._infer_columns(df)
+        self._cols = cols
         return df
 
-    def _infer_columns(self, df: pd.DataFrame) -> MRDSColumns:
-        cols = list(df.columns)
+    @staticmethod
+    def _build_country_index(country_lc: pd.Series) -> dict[str, np.ndarray]:
+        # Inverted index: exact lowercase country -> row ids, so the common
+        # "filter by country" case is a dict lookup instead of a full-column
+        # substring scan. Alias keys point at their canonical rows.
+        codes, uniques = pd.factorize(country_lc)
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=len(uniques))
+        index: dict[str, np.ndarray] = {}
+        offset = 0
+        for value, count in zip(uniques, counts):
+            index[str(value)] = order[offset : offset + count]
+            offset += count
+
+        for alias_key, alias_names in _COUNTRY_ALIASES.items():
+            rows = [index[n.lower()] for n in alias_names if n.lower() in index]
+            if rows and alias_key not in index:
+                index[alias_key] = np.sort(np.concatenate(rows))
+        return index
+
+    def _infer_columns(self, cols: list[str]) -> MRDSColumns:
         lat = _find_column(cols, ["latitude"]) or _find_column(cols, ["lat"])
         lon = _find_column(cols, ["longitude"]) or _find_column(cols, ["lon"]) or _find_column(
             cols, ["long"]
@@ -129,80 +288,106 @@ class MRDSClient:
         cols = self._cols
         assert cols
 
-        work = df.copy()
+        # Compose the filters as one boolean mask over the shared frame
+        # instead of copying and repeatedly reslicing it; only the matched
+        # rows ever materialize.
+        mask = np.ones(len(df), dtype=bool)
         if country and cols.country:
             normalized = _normalize_country(country)
-            work = work[
-                work[cols.country].astype(str).str.contains(normalized, case=False, na=False, regex=False)
-            ]
-            if work.empty:
+            rows = self._country_index.get(normalized.lower())
+            if rows is not None:
+                country_mask = np.zeros(len(df), dtype=bool)
+                country_mask[rows] = True
+            else:
+                # Partial names miss the exact-match index; fall back to the
+                # substring scan.
+                country_mask = (
+                    df["_country_lc"]
+                    .str.contains(normalized.lower(), na=False, regex=False)
+                    .to_numpy(dtype=bool)
+                )
+            if not country_mask.any():
                 for alt in _country_aliases(normalized):
-                    work = df[
-                        df[cols.country]
-                        .astype(str)
-                        .str.contains(alt, case=False, na=False, regex=False)
-                    ]
-                    if not work.empty:
+                    country_mask = (
+                        df["_country_lc"]
+                        .str.contains(alt.lower(), na=False, regex=False)
+                        .to_numpy(dtype=bool)
+                    )
+                    if country_mask.any():
                         break
-
-        # Combine commodity fields into a single string for filtering
-        commodity_df = work[cols.commodity_fields].astype(str).fillna("")
-        commodity_blob = commodity_df.apply(
-            lambda r: " ; ".join(r.values.astype(str)), axis=1
-        )
-        commodity_blob = commodity_blob.astype(str).str.lower()
+            mask &= country_mask
         if commodity:
-            work = work[commodity_blob.str.contains(commodity.lower(), na=False)]
-            commodity_blob = commodity_blob[work.index]
-
-        # Coordinates
-        work = work.dropna(subset=[cols.latitude, cols.longitude])
-        work[cols.latitude] = pd.to_numeric(work[cols.latitude], errors="coerce")
-        work[cols.longitude] = pd.to_numeric(work[cols.longitude], errors="coerce")
-        work = work.dropna(subset=[cols.latitude, cols.longitude])
-
-        results: list[dict[str, Any]] = []
-        for idx, row in work.head(limit).iterrows():
-            name = None
-            if cols.site_name and pd.notna(row.get(cols.site_name)):
-                name = str(row.get(cols.site_name))
-
-            commodities = [
-                c.strip()
-                for c in str(commodity_blob.loc[idx]).replace(",", ";").split(";")
-                if c.strip()
+            needle = commodity.lower()
+            commodity_mask = self._commodity_masks.get(needle)
+            if commodity_mask is None:
+                commodity_mask = (
+                    df["_commodity_blob_lc"]
+                    .str.contains(needle, na=False, regex=False)
+                    .to_numpy(dtype=bool)
+                )
+                if len(self._commodity_masks) >= 64:
+                    self._commodity_masks.clear()
+                self._commodity_masks[needle] = commodity_mask
+            mask &= commodity_mask
+
+        mask &= df["_has_coords"].to_numpy(dtype=bool)
+
+        # Pull the result columns out as arrays/lists for the first `limit`
+        # matches; the dicts are assembled by zipping those instead of
+        # iterrows.
+        idx = np.flatnonzero(mask)[:limit]
+        lats = df[cols.latitude].to_numpy()[idx]
+        lngs = df[cols.longitude].to_numpy()[idx]
+        if cols.site_name:
+            names = [
+                str(v) if pd.notna(v) else None for v in df[cols.site_name].iloc[idx]
             ]
+        else:
+            names = [None] * len(idx)
+        if cols.country:
+            countries = [str(c) for c in df[cols.country].iloc[idx]]
+        else:
+            countries = [None] * len(idx)
+        commodity_lists = (
+            df["_commodity_blob_lc"]
+            .iloc[idx]
+            .str.replace(",", ";", regex=False)
+            .str.split(";")
+            .tolist()
+        )
 
-            results.append(
-                {
-                    "name": name or "Unknown",
-                    "lat": float(row.get(cols.latitude)),
-                    "lng": float(row.get(cols.longitude)),
-                    "country": str(row.get(cols.country)) if cols.country else None,
-                    "commodities": commodities[:10],
-                    "source": "mrds",
-                }
+        return [
+            {
+                "name": name or "Unknown",
+                "lat": float(lat),
+                "lng": float(lng),
+                "country": country_name,
+                "commodities": [p.strip() for p in pieces if p.strip()][:10],
+                "source": "mrds",
+            }
+            for name, lat, lng, country_name, pieces in zip(
+                names, lats, lngs, countries, commodity_lists
             )
-
-        return results
+        ]
 
 
 def _normalize_country(name: str) -> str:
     return name.replace(",", "").replace("  ", " ").strip()
 
 
+_COUNTRY_ALIASES = {
+    "congo democratic republic": ["Congo (Kinshasa)", "Democratic Republic of the Congo"],
+    "congo republic": ["Congo (Brazzaville)", "Republic of the Congo"],
+    "russia": ["Russian Federation"],
+    "bolivia": ["Bolivia (Plurinational State of)"],
+    "iran": ["Iran (Islamic Republic of)"],
+    "tanzania": ["Tanzania, United Republic of"],
+    "south korea": ["Korea, Republic of", "Republic of Korea"],
+    "north korea": ["Korea, Democratic People's Republic of"],
+    "vietnam": ["Viet Nam"],
+    "laos": ["Lao People's Democratic Republic"],
+}
+
+
 def _country_aliases(name: str) -> list[str]:
-    key = name.lower()
-    aliases = {
-        "congo democratic republic": ["Congo (Kinshasa)", "Democratic Republic of the Congo"],
-        "congo republic": ["Congo (Brazzaville)", "Republic of the Congo"],
-        "russia": ["Russian Federation"],
-        "bolivia": ["Bolivia (Plurinational State of)"],
-        "iran": ["Iran (Islamic Republic of)"],
-        "tanzania": ["Tanzania, United Republic of"],
-        "south korea": ["Korea, Republic of", "Republic of Korea"],
-        "north korea": ["Korea, Democratic People's Republic of"],
-        "vietnam": ["Viet Nam"],
-        "laos": ["Lao People's Democratic Republic"],
-    }
-    return aliases.get(key, [])
+    return _COUNTRY_ALIASES.get(name.lower(), [])
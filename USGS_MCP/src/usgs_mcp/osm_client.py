@@ -1,13 +1,53 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import time
+from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 OVERPASS_URL = "https://overpass-api.de/api/interpreter"
 
+# Overpass answers are effectively static for hours and the queries cost
+# 5-25 s, so responses are cached on disk keyed by query text.
+_CACHE_TTL = 24 * 3600.0
 
-def _overpass_query(country: str) -> str:
+
+def _cache_dir() -> Path:
+    override = os.environ.get("USGS_CACHE_DIR")
+    if override:
+        return Path(override).expanduser().resolve()
+    return Path(__file__).resolve().parents[2] / ".cache"
+
+
+def _fetch_overpass(query: str) -> dict[str, Any]:
+    key = hashlib.blake2b(query.encode()).hexdigest()[:16]
+    path = _cache_dir() / "osm" / f"{key}.json"
+    if path.exists() and time.time() - path.stat().st_mtime < _CACHE_TTL:
+        return orjson.loads(path.read_bytes())
+
+    try:
+        with httpx.Client(timeout=60) as client:
+            resp = client.post(OVERPASS_URL, data=query)
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+    except httpx.HTTPError:
+        # Serve an expired copy rather than failing when Overpass is down.
+        if path.exists():
+            return orjson.loads(path.read_bytes())
+        raise
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(resp.content)
+    return data
+
+
+def _overpass_query(country: str, limit: int = 200) -> str:
+    # The out clause carries the caller's limit so Overpass truncates
+    # server-side instead of shipping megabytes that get discarded here.
     return f"""
 [out:json][timeout:25];
 area["name"="{country}"]["admin_level"="2"]->.a;
@@ -19,28 +59,27 @@ area["name"="{country}"]["admin_level"="2"]->.a;
   way(area.a)["landuse"="quarry"];
   relation(area.a)["landuse"="quarry"];
 );
-out center 200;
+out center {limit};
 """.strip()
 
 
-def _matches_commodity(tags: dict[str, Any], commodity: str | None) -> bool:
-    if not commodity:
+def _matches_commodity(tags: dict[str, Any], needle: str | None) -> bool:
+    # Short-circuits on the first matching tag value instead of joining
+    # and lowercasing the whole dict; the needle is lowered once upstream.
+    if not needle:
         return True
-    hay = " ".join(str(v) for v in tags.values()).lower()
-    return commodity.lower() in hay
+    return any(needle in str(v).lower() for v in tags.values())
 
 
 def search_osm_mines(country: str, commodity: str | None = None, limit: int = 200) -> list[dict[str, Any]]:
-    query = _overpass_query(country)
-    with httpx.Client(timeout=60) as client:
-        resp = client.post(OVERPASS_URL, data=query)
-        resp.raise_for_status()
-        data = resp.json()
+    query = _overpass_query(country, limit)
+    data = _fetch_overpass(query)
 
+    needle = commodity.lower() if commodity else None
     results: list[dict[str, Any]] = []
     for element in data.get("elements", []):
         tags = element.get("tags") or {}
-        if not _matches_commodity(tags, commodity):
+        if not _matches_commodity(tags, needle):
             continue
 
         lat = element.get("lat")
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import json
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import httpx
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 SCIENCEBASE_ITEM_ID_DEFAULT = "696a75d5d4be0228872d3bf8"  # MCS 2026 data release
 SCIENCEBASE_ITEM_URL = "https://www.sciencebase.gov/catalog/item/{item_id}?format=json"
@@ -23,31 +29,62 @@ def _normalize_col(col: str) -> str:
     return col.strip().lower().replace(" ", "_").replace("-", "_")
 
 
-def _find_column(columns: list[str], keywords: list[str]) -> str | None:
-    for col in columns:
-        lower = col.lower()
-        if all(k in lower for k in keywords):
+def _find_column(lc_cols: list[str], keywords: list[str]) -> str | None:
+    # Expects already-lowercased names; _infer_columns lowers the column
+    # list once instead of per _find_column call.
+    for col in lc_cols:
+        if all(k in col for k in keywords):
             return col
     return None
 
 
+_YEAR_RE = re.compile(r"(?P<y>\d{4})")
+
+
 def _parse_year(series: pd.Series) -> pd.Series:
-    # Extract the first 4-digit year from strings like "2021–24".
-    year_str = series.astype(str).str.extract(r"(\d{4})", expand=False)
-    return pd.to_numeric(year_str, errors="coerce")
+    # Extract the first 4-digit year from strings like "2021–24", via
+    # Arrow's regex kernel over contiguous UTF-8 buffers rather than the
+    # per-row object path of Series.str.extract.
+    arr = pa.array(series.astype(str), type=pa.string())
+    years = pc.struct_field(pc.extract_regex(arr, pattern=_YEAR_RE.pattern), "y")
+    return pd.to_numeric(pd.Series(years.to_pandas(), index=series.index), errors="coerce")
+
+
+# Strips everything but digits, dot and minus — covers the thousands
+# separators and the —/../… placeholder glyphs in one pass.
+_CLEAN_RE = re.compile(r"[^0-9.\-]")
 
 
 def _parse_value(series: pd.Series) -> pd.Series:
-    # Remove commas and non-numeric characters, keep minus and dot.
-    cleaned = (
-        series.astype(str)
-        .str.replace(",", "", regex=False)
-        .str.replace("—", "", regex=False)
-        .str.replace("..", "", regex=False)
-        .str.replace("…", "", regex=False)
-        .str.replace(r"[^0-9.\\-]", "", regex=True)
-    )
-    return pd.to_numeric(cleaned, errors="coerce")
+    # One regex pass through Arrow's replace kernel; placeholder-only
+    # cells reduce to dots/empty and coerce to NaN as before.
+    arr = pa.array(series.astype(str), type=pa.string())
+    cleaned = pc.replace_substring_regex(arr, pattern=_CLEAN_RE.pattern, replacement="")
+    return pd.to_numeric(pd.Series(cleaned.to_pandas(), index=series.index), errors="coerce")
+
+
+def _pick_unit(df: pd.DataFrame, unit_col: str | None) -> str | None:
+    # Units are constant within a commodity/statistic slice of the MCS
+    # data, so the first non-null value stands in for the old full-column
+    # mode (which sorted the whole unit column per query).
+    if not unit_col:
+        return None
+    units = df[unit_col].dropna()
+    if units.empty:
+        return None
+    return str(units.iloc[0])
+
+
+# Country-column names that aggregate over real countries; these rows are
+# dropped at load so per-query filters never have to exclude them.
+_AGGREGATE_ROWS = frozenset({"world total", "other countries", "world", "total"})
+
+
+# Parsed release data shared across client instances, keyed by ScienceBase
+# item id: the frame, its column map and the exact-match lookup indices.
+# Loading the CSV dominates cold-start latency, so it happens once per
+# process rather than once per USGSMCSClient.
+_MCS_CACHE: dict[str, tuple[pd.DataFrame, "ColumnMap", dict[str, dict[str, np.ndarray]]]] = {}
 
 
 @dataclass
@@ -65,6 +102,8 @@ class USGSMCSClient:
         self.item_id = item_id or os.environ.get("USGS_MCS_ITEM_ID", SCIENCEBASE_ITEM_ID_DEFAULT)
         self._df: pd.DataFrame | None = None
         self._col_map: ColumnMap | None = None
+        self._exact: dict[str, dict[str, np.ndarray]] = {}
+        self._ranking_cache: dict[tuple, dict[str, Any]] = {}
 
     def _get_item_json(self) -> dict[str, Any]:
         url = SCIENCEBASE_ITEM_URL.format(item_id=self.item_id)
@@ -98,40 +137,149 @@ class USGSMCSClient:
         )
 
     def _download_csv(self) -> Path:
-        cache = _cache_dir()
+        # Files live under a per-item directory so switching
+        # USGS_MCS_ITEM_ID can never pick up the wrong release.
+        cache = _cache_dir() / self.item_id
         cache.mkdir(parents=True, exist_ok=True)
 
         item_json = self._get_item_json()
         filename, url = self._pick_data_file(item_json)
         dest = cache / filename
+        meta_path = dest.with_suffix(".meta.json")
 
+        headers: dict[str, str] = {}
         if dest.exists():
-            return dest
-
+            # Revalidate with the stored ETag/Last-Modified instead of
+            # trusting the cached file forever; without validators the
+            # old unconditional short-circuit still applies.
+            meta: dict[str, Any] = {}
+            if meta_path.exists():
+                meta = json.loads(meta_path.read_text())
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            if not headers:
+                return dest
+
+        # Stream to disk in chunks rather than buffering the whole body;
+        # httpx decompresses gzip transparently on the way through.
         with httpx.Client(timeout=60) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            dest.write_bytes(resp.content)
-
+            with client.stream("GET", url, headers=headers) as resp:
+                if resp.status_code == 304:
+                    return dest
+                resp.raise_for_status()
+                with dest.open("wb") as f:
+                    for chunk in resp.iter_bytes(chunk_size=1 << 20):
+                        f.write(chunk)
+
+        # A fresh body invalidates the parsed Parquet sibling.
+        dest.with_suffix(".parquet").unlink(missing_ok=True)
+        meta_path.write_text(
+            json.dumps(
+                {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+            )
+        )
         return dest
 
+    @staticmethod
+    def _read_csv(csv_path: Path) -> pd.DataFrame:
+        # pyarrow's multithreaded parser loads the MCS release far faster
+        # than pandas' engine. Column names and types vary by release, so
+        # the schema stays inferred rather than pre-declared.
+        try:
+            table = pacsv.read_csv(
+                csv_path, read_options=pacsv.ReadOptions(block_size=1 << 20)
+            )
+        except (pa.ArrowInvalid, UnicodeDecodeError):
+            # USGS data releases sometimes use Windows-1252 encoding.
+            table = pacsv.read_csv(
+                csv_path,
+                read_options=pacsv.ReadOptions(block_size=1 << 20, encoding="cp1252"),
+            )
+        # Arrow-backed dtypes keep strings in contiguous UTF-8 buffers, so
+        # the string ops downstream dispatch to Arrow kernels instead of
+        # boxing per element.
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
     def _load_dataframe(self) -> pd.DataFrame:
         if self._df is not None:
             return self._df
 
-        csv_path = self._download_csv()
-        try:
-            df = pd.read_csv(csv_path, encoding="utf-8")
-        except UnicodeDecodeError:
-            # USGS data releases sometimes use Windows-1252 encoding.
-            df = pd.read_csv(csv_path, encoding="cp1252")
-        df.columns = [_normalize_col(c) for c in df.columns]
-        self._df = df
-        self._col_map = self._infer_columns(df)
-        return df
+        cached = _MCS_CACHE.get(self.item_id)
+        if cached is None:
+            csv_path = self._download_csv()
+            parquet_path = csv_path.with_suffix(".parquet")
+            if parquet_path.exists():
+                # Columnar cache written on a previous start; column names
+                # are already normalized and value/year already parsed.
+                df = pd.read_parquet(
+                    parquet_path, engine="pyarrow", dtype_backend="pyarrow"
+                )
+                col_map = self._infer_columns(df)
+            else:
+                df = self._read_csv(csv_path)
+                df.columns = [_normalize_col(c) for c in df.columns]
+                col_map = self._infer_columns(df)
+                # Value and year parse once here; the query methods reuse
+                # the numeric columns instead of re-parsing every filtered
+                # subset, and the Parquet cache persists the parsed form.
+                df[col_map.value] = _parse_value(df[col_map.value])
+                df[col_map.year] = _parse_year(df[col_map.year])
+                df.to_parquet(parquet_path, compression="zstd")
+            # Aggregate rows ("World total", "Other countries") drop out
+            # once here instead of being re-masked on every ranking call;
+            # they would also pollute list_countries and country profiles.
+            lc = df[col_map.country].astype(str).str.lower()
+            agg_mask = lc.isin(_AGGREGATE_ROWS).to_numpy(dtype=bool)
+            if agg_mask.any():
+                df = df[~agg_mask].reset_index(drop=True)
+            # Low-cardinality text columns become categoricals: groupby
+            # hashes small integer codes instead of full strings and the
+            # categories double as the list_* outputs. (No-op when the
+            # Parquet cache round-trips them as categories already.)
+            for c in (col_map.commodity, col_map.country, col_map.statistic, col_map.unit):
+                if c:
+                    df[c] = df[c].astype("category")
+            # Pre-lowered filter columns: the substring fallback in
+            # _filtered runs case-sensitive against these Arrow strings
+            # instead of lowering the haystack on every query.
+            for role, c in (
+                ("commodity", col_map.commodity),
+                ("country", col_map.country),
+                ("statistic", col_map.statistic),
+            ):
+                if c:
+                    df[f"_{role}_lc"] = (
+                        df[c].astype(str).str.lower().astype("string[pyarrow]")
+                    )
+            # Exact-match indices: lowercase name -> row positions, so the
+            # common exact commodity/country query is a dict lookup plus a
+            # take instead of a full-column substring scan.
+            exact = {
+                "commodity": {
+                    str(k).lower(): v
+                    for k, v in df.groupby(col_map.commodity).indices.items()
+                },
+                "country": {
+                    str(k).lower(): v
+                    for k, v in df.groupby(col_map.country).indices.items()
+                },
+            }
+            cached = (df, col_map, exact)
+            _MCS_CACHE[self.item_id] = cached
+
+        self._df, self._col_map, self._exact = cached
+        return self._df
 
     def _infer_columns(self, df: pd.DataFrame) -> ColumnMap:
-        cols = list(df.columns)
+        # Lower every name once up front; the dozen _find_column calls
+        # below scan the pre-lowered list and map hits back at the end.
+        lc_to_orig = {c.lower(): c for c in df.columns}
+        cols = list(lc_to_orig)
         commodity = _find_column(cols, ["commodity"]) or _find_column(cols, ["mineral"])
         country = _find_column(cols, ["country"]) or _find_column(cols, ["nation"])
         year = _find_column(cols, ["year"])
@@ -143,6 +291,10 @@ class USGSMCSClient:
         )
         unit = _find_column(cols, ["unit"])
         statistic = _find_column(cols, ["statistic"]) or _find_column(cols, ["measure"])
+        commodity, country, year, value, unit, statistic = (
+            lc_to_orig[c] if c is not None else None
+            for c in (commodity, country, year, value, unit, statistic)
+        )
 
         missing = [name for name, col in [("commodity", commodity), ("country", country), ("year", year), ("value", value)] if col is None]
         if missing:
@@ -165,30 +317,45 @@ class USGSMCSClient:
         col = self._col_map
         assert col
 
-        out = df
-        if commodity:
-            out = out[
-                out[col.commodity]
-                .astype(str)
-                .str.contains(commodity, case=False, na=False, regex=False)
-            ]
-        if country:
-            out = out[out[col.country].astype(str).str.contains(country, case=False, na=False)]
+        # Each filter contributes one boolean array ANDed into a single
+        # compound mask, so the frame is copied once at the end instead of
+        # once per chained indexing step. Exact (case-insensitive) names
+        # hit the precomputed row-position indices; partial names fall
+        # back to the substring scan.
+        mask = np.ones(len(df), dtype=bool)
+        for arg, role in ((commodity, "commodity"), (country, "country")):
+            if not arg:
+                continue
+            hit = self._exact[role].get(arg.lower())
+            if hit is not None:
+                m = np.zeros(len(df), dtype=bool)
+                m[hit] = True
+            else:
+                m = (
+                    df[f"_{role}_lc"]
+                    .str.contains(arg.lower(), na=False, regex=False)
+                    .to_numpy(dtype=bool)
+                )
+            mask &= m
         if statistic_type and col.statistic:
-            out = out[out[col.statistic].astype(str).str.contains(statistic_type, case=False, na=False)]
-        return out
+            mask &= (
+                df["_statistic_lc"]
+                .str.contains(statistic_type.lower(), na=False, regex=False)
+                .to_numpy(dtype=bool)
+            )
+        return df if mask.all() else df[mask]
 
     def list_commodities(self) -> list[str]:
         df = self._load_dataframe()
         col = self._col_map
         assert col
-        return sorted(df[col.commodity].dropna().astype(str).unique().tolist())
+        return sorted(str(c) for c in df[col.commodity].cat.categories)
 
     def list_countries(self) -> list[str]:
         df = self._load_dataframe()
         col = self._col_map
         assert col
-        return sorted(df[col.country].dropna().astype(str).unique().tolist())
+        return sorted(str(c) for c in df[col.country].cat.categories)
 
     def get_country_ranking(
         self,
@@ -197,17 +364,22 @@ class USGSMCSClient:
         statistic_type: str = "Production",
         top_n: int = 10,
     ) -> dict[str, Any]:
+        # The MCP workload re-asks the same rankings; results memoize per
+        # argument tuple since the release data never changes in-process.
+        key = (commodity.lower(), year, statistic_type.lower(), top_n)
+        hit = self._ranking_cache.get(key)
+        if hit is not None:
+            return hit
+
         df = self._filtered(commodity=commodity, statistic_type=statistic_type)
         col = self._col_map
         assert col
 
-        df[col.value] = _parse_value(df[col.value])
-        df[col.year] = _parse_year(df[col.year])
         df = df.dropna(subset=[col.value, col.year])
 
         # Ensure we only use Production rows for rankings
         if col.statistic:
-            df = df[df[col.statistic].astype(str).str.contains("Production", case=False, na=False)]
+            df = df[df["_statistic_lc"].str.contains("production", na=False, regex=False)]
 
         if year is None:
             year_max = df[col.year].max()
@@ -216,34 +388,34 @@ class USGSMCSClient:
             year = int(year_max)
         df = df[df[col.year] == year]
 
-        grouped = df.groupby(col.country, as_index=False)[col.value].sum()
-        # Drop aggregate rows if present
-        grouped = grouped[
-            ~grouped[col.country]
-            .astype(str)
-            .str.lower()
-            .isin(["world total", "other countries"])
+        # Sum per country with bincount over the categorical codes — one
+        # tight C pass instead of a groupby hash table per request.
+        cats = df[col.country].cat.categories
+        codes = df[col.country].cat.codes.to_numpy()
+        vals = df[col.value].to_numpy(dtype=float)
+        valid = codes >= 0
+        totals = np.bincount(codes[valid], weights=vals[valid], minlength=len(cats))
+        counts = np.bincount(codes[valid], minlength=len(cats))
+
+        # Aggregate rows are gone since load time; only drop countries
+        # absent from this year's subset.
+        eligible = np.flatnonzero(counts > 0)
+
+        total = float(totals[eligible].sum())
+        order = eligible[np.argsort(-totals[eligible])][:top_n]
+        rankings = [
+            {
+                "rank": i + 1,
+                "country": str(cats[j]),
+                "quantity": float(totals[j]),
+                "share_percent": float((totals[j] / total) * 100) if total else 0.0,
+            }
+            for i, j in enumerate(order)
         ]
-        grouped = grouped.sort_values(col.value, ascending=False)
-
-        total = grouped[col.value].sum()
-        rankings = []
-        for i, row in grouped.head(top_n).iterrows():
-            quantity = float(row[col.value])
-            rankings.append(
-                {
-                    "rank": len(rankings) + 1,
-                    "country": str(row[col.country]),
-                    "quantity": quantity,
-                    "share_percent": float((quantity / total) * 100) if total else 0.0,
-                }
-            )
 
-        units = None
-        if col.unit and not df[col.unit].dropna().empty:
-            units = df[col.unit].dropna().astype(str).mode().iloc[0]
+        units = _pick_unit(df, col.unit)
 
-        return {
+        result = {
             "commodity": commodity,
             "year": year,
             "statistic_type": statistic_type,
@@ -251,6 +423,10 @@ class USGSMCSClient:
             "total_quantity": float(total) if total else 0.0,
             "rankings": rankings,
         }
+        if len(self._ranking_cache) >= 256:
+            self._ranking_cache.clear()
+        self._ranking_cache[key] = result
+        return result
 
     def get_time_series(
         self,
@@ -262,16 +438,15 @@ class USGSMCSClient:
         col = self._col_map
         assert col
 
-        df[col.value] = _parse_value(df[col.value])
-        df[col.year] = _parse_year(df[col.year])
         df = df.dropna(subset=[col.value, col.year])
 
-        grouped = df.groupby(col.year, as_index=False)[col.value].sum().sort_values(col.year)
-        points = [{"year": int(r[col.year]), "quantity": float(r[col.value])} for _, r in grouped.iterrows()]
+        # np.unique returns sorted years; bincount over the inverse codes
+        # sums each year's values in one pass.
+        years, inv = np.unique(df[col.year].to_numpy(dtype=float), return_inverse=True)
+        sums = np.bincount(inv, weights=df[col.value].to_numpy(dtype=float))
+        points = [{"year": int(y), "quantity": float(q)} for y, q in zip(years, sums)]
 
-        units = None
-        if col.unit and not df[col.unit].dropna().empty:
-            units = df[col.unit].dropna().astype(str).mode().iloc[0]
+        units = _pick_unit(df, col.unit)
 
         return {
             "commodity": commodity,
@@ -292,24 +467,21 @@ class USGSMCSClient:
         col = self._col_map
         assert col
 
-        df[col.value] = _parse_value(df[col.value])
-        df[col.year] = _parse_year(df[col.year])
         df = df.dropna(subset=[col.value, col.year])
 
         if year is None:
             year = int(df[col.year].max())
         df = df[df[col.year] == year]
 
-        grouped = df.groupby(col.commodity, as_index=False)[col.value].sum()
+        grouped = df.groupby(col.commodity, as_index=False, observed=True)[col.value].sum()
         grouped = grouped.sort_values(col.value, ascending=False)
 
-        units = None
-        if col.unit and not df[col.unit].dropna().empty:
-            units = df[col.unit].dropna().astype(str).mode().iloc[0]
+        units = _pick_unit(df, col.unit)
 
+        head = grouped.head(limit)
         commodities = [
-            {"commodity": str(r[col.commodity]), "quantity": float(r[col.value]), "units": units}
-            for _, r in grouped.head(limit).iterrows()
+            {"commodity": str(c), "quantity": float(v), "units": units}
+            for c, v in zip(head[col.commodity].tolist(), head[col.value].to_numpy())
         ]
 
         return {